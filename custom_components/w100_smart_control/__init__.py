@@ -10,6 +10,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import W100Coordinator
@@ -102,7 +103,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             {
                 "device_name": device_name,
                 "diagnostic_info": diagnostic_info,
-                "timestamp": hass.helpers.utcnow().isoformat(),
+                "timestamp": dt_util.utcnow().isoformat(),
             }
         )
     
@@ -145,7 +146,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 "errors": validation_result["errors"],
                 "warnings": validation_result["warnings"],
                 "device_status": validation_result["device_status"],
-                "timestamp": hass.helpers.utcnow().isoformat(),
+                "timestamp": dt_util.utcnow().isoformat(),
             }
         )
     
@@ -176,6 +177,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         # Clean up all thermostats and resources when integration is removed
         await coordinator.async_cleanup()
+        
+        from .device_trigger import clear_device_name_cache
+        clear_device_name_cache()
     
     return unload_ok
 
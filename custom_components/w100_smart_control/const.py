@@ -2,6 +2,9 @@
 
 DOMAIN = "w100_smart_control"
 
+# Event fired for W100 button presses, consumed by device triggers
+EVENT_BUTTON_ACTION = f"{DOMAIN}_button_action"
+
 # Configuration keys
 CONF_W100_DEVICE_NAME = "w100_device_name"
 CONF_CLIMATE_ENTITY_TYPE = "climate_entity_type"
@@ -62,4 +65,9 @@ W100_ACTION_MINUS = "minus"
 
 # Update intervals
 UPDATE_INTERVAL_SECONDS = 30
-DISPLAY_UPDATE_DELAY_SECONDS = 1
\ No newline at end of file
+DISPLAY_UPDATE_DELAY_SECONDS = 1
+STATE_UPDATE_COALESCE_SECONDS = 0.5
+DISPLAY_PUBLISH_COALESCE_SECONDS = 0.05
+DISPLAY_SYNC_COALESCE_SECONDS = 0.5
+DISPLAY_RETRY_MAX_DELAY_SECONDS = 10.0
+THERMOSTAT_SAVE_DELAY_SECONDS = 1.5
\ No newline at end of file
@@ -2,22 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
+import random
 import re
+import sys
+import time
+from functools import partial
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Any
+from collections.abc import Callable, Coroutine, Iterator, KeysView, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import entity_registry as er, device_registry as dr
 from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.storage import Store
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.components.mqtt.subscription import (
+    async_prepare_subscribe_topics,
+    async_subscribe_topics,
+    async_unsubscribe_topics,
+)
+from homeassistant.util import dt as dt_util
 
 from .exceptions import (
     W100IntegrationError,
@@ -38,6 +53,7 @@ GENERIC_THERMOSTAT_DOMAIN = "generic_thermostat"
 
 from .const import (
     DOMAIN, 
+    EVENT_BUTTON_ACTION,
     UPDATE_INTERVAL_SECONDS,
     CONF_GENERIC_THERMOSTAT_CONFIG,
     CONF_HEATER_SWITCH,
@@ -80,10 +96,230 @@ from .const import (
     W100_ACTION_PLUS,
     W100_ACTION_MINUS,
     DISPLAY_UPDATE_DELAY_SECONDS,
+    STATE_UPDATE_COALESCE_SECONDS,
+    DISPLAY_PUBLISH_COALESCE_SECONDS,
+    DISPLAY_RETRY_MAX_DELAY_SECONDS,
+    DISPLAY_SYNC_COALESCE_SECONDS,
+    THERMOSTAT_SAVE_DELAY_SECONDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Prefer orjson for MQTT payloads; it accepts bytes and str directly and
+# serializes straight to bytes, which mqtt.async_publish accepts as-is
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError, ValueError)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+# Every key the display sync helpers may set, in a stable order
+_DISPLAY_PAYLOAD_KEYS = (
+    "temperature", "current_temperature", "fan_speed", "humidity", "swing_mode",
+    "warm_level", "idle_temperature", "beep", "beep_on_change", "display_brightness",
+    "last_action", "action_age", "status", "last_update_ts",
+)
+
+# Display payload keys that change on every sync and carry no display state
+_VOLATILE_DISPLAY_KEYS = frozenset({"last_update_ts", "action_age"})
+
+# W100 state payload keys tracked in device state
+_W100_STATE_VALID_KEYS = frozenset(
+    {"temperature", "humidity", "battery", "linkquality", "voltage"}
+)
+
+# HVAC mode -> (display payload fields, display_mode) used when its sync handler fails
+_DISPLAY_MODE_FALLBACKS: dict[str, tuple[dict[str, Any], str]] = {
+    "heat": ({"temperature": DEFAULT_HEATING_TEMPERATURE}, "temperature"),
+    "off": ({"fan_speed": int(DEFAULT_IDLE_FAN_SPEED)}, "fan_speed"),
+    "fan": ({"fan_speed": 3}, "fan_speed"),
+    "cool": ({"temperature": DEFAULT_TARGET_TEMP}, "temperature"),
+}
+
+# Beep mode -> (display payload fields, beep_enabled); "On-Mode Change" beeps
+# only on mode changes, unknown modes add no fields but leave beep enabled
+_BEEP_MODE_DISPLAY: dict[str, tuple[dict[str, bool], bool]] = {
+    "Enable Beep": ({"beep": True}, True),
+    "Disable Beep": ({"beep": False}, False),
+    "On-Mode Change": ({"beep_on_change": True}, True),
+}
+_BEEP_MODE_DEFAULT: tuple[dict[str, bool], bool] = ({}, True)
+# Display payload keys set by any beep mode
+_BEEP_DISPLAY_KEYS = frozenset(
+    key for beep_fields, _ in _BEEP_MODE_DISPLAY.values() for key in beep_fields
+)
+
+# Named climate fan modes mapped to W100 fan speeds (1-9)
+_FAN_SPEED_MAP: Final[dict[str, int]] = {
+    "low": 1, "medium": 3, "high": 6, "auto": 3,
+    "quiet": 1, "normal": 3, "turbo": 9,
+}
+
+# Entity states that carry no usable sensor value
+_UNAVAILABLE_STATES: Final = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
+# Entity ID name sanitizing: non-alphanumerics become "_", runs of "_" collapse
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# Original names of thermostats created by this integration contain both "W100" and "Thermostat"
+_W100_THERMOSTAT_NAME_RE = re.compile(r'W100.*Thermostat|Thermostat.*W100', re.DOTALL)
+
+# Defaults for optional generic thermostat settings
+_THERMOSTAT_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    CONF_MIN_TEMP: DEFAULT_MIN_TEMP,
+    CONF_MAX_TEMP: DEFAULT_MAX_TEMP,
+    CONF_TARGET_TEMP: DEFAULT_TARGET_TEMP,
+    CONF_COLD_TOLERANCE: DEFAULT_COLD_TOLERANCE,
+    CONF_HOT_TOLERANCE: DEFAULT_HOT_TOLERANCE,
+    CONF_PRECISION: DEFAULT_PRECISION,
+})
+
+# Thermostat config keys whose change requires recreating the entity
+_CRITICAL_THERMOSTAT_KEYS = ("heater", "target_sensor", "unique_id")
+
+# W100 button actions handled by the coordinator
+_W100_VALID_ACTIONS = frozenset({W100_ACTION_TOGGLE, W100_ACTION_PLUS, W100_ACTION_MINUS})
+
+
+def _clamp_fan_speed(fan_speed: int) -> int:
+    """Clamp a fan speed to the W100's 1-9 range."""
+    return 1 if fan_speed < 1 else 9 if fan_speed > 9 else fan_speed
+
+
+def _clamp_humidity(humidity: float) -> float:
+    """Clamp a humidity reading to 0-100%."""
+    return 0 if humidity < 0 else 100 if humidity > 100 else humidity
+
+
+def _coerce_config_value(config: Mapping[str, Any], key: str, default: Any, convert: Callable[[Any], Any]) -> Any:
+    """Convert a config value, falling back to the default if it is malformed."""
+    value = config.get(key, default)
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        _LOGGER.warning("Invalid %s value %r, using default %s", key, value, default)
+        return convert(default)
+
+
+@dataclass(slots=True, eq=False)
+class W100DeviceState(MutableMapping):
+    """Runtime state of a W100 device.
+    
+    Values used on every action and display sync are slot fields, read and
+    written as attributes. The mapping interface of the plain dict this
+    replaces is kept, so entities and diagnostics can still use
+    ``state.get("last_action")``; keys without a field (raw W100 payload
+    values such as battery, per-sensor status) are kept in ``extra``.
+    Unset fields are None, which ``get()`` treats like a missing key so
+    callers' defaults still apply.
+    """
+
+    device_name: str | None = None
+    current_mode: str | None = None
+    target_temperature: float | None = None
+    current_temperature: float | None = None
+    fan_speed: int | None = None
+    humidity: float | None = None
+    display_mode: str | None = None
+    beep_enabled: bool = True
+    last_action: str | None = None
+    last_action_time: datetime | None = None
+    last_action_monotonic: float | None = None
+    last_seen: datetime | None = None
+    last_update: datetime | None = None
+    last_display_sync: datetime | None = None
+    last_sync_mode: str | None = None
+    last_sync_payload: dict[str, Any] | None = None
+    status: str | None = None
+    climate_entity_id: str | None = None
+    config: dict[str, Any] | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _DEVICE_STATE_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _DEVICE_STATE_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _DEVICE_STATE_FIELDS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _DEVICE_STATE_FIELDS:
+            raise KeyError(f"Cannot delete device state field '{key}'")
+        del self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _DEVICE_STATE_FIELD_ORDER
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(_DEVICE_STATE_FIELD_ORDER) + len(self.extra)
+
+
+_DEVICE_STATE_FIELD_ORDER = tuple(
+    state_field.name for state_field in fields(W100DeviceState) if state_field.name != "extra"
+)
+_DEVICE_STATE_FIELDS = frozenset(_DEVICE_STATE_FIELD_ORDER)
+
+
+@dataclass(frozen=True, slots=True)
+class _DisplayConfig:
+    """Display sync settings of a W100 device, coerced once from its config."""
+
+    heating_temperature: float
+    heating_warm_level: int
+    idle_fan_speed: int
+    idle_temperature: float
+    idle_warm_level: int
+    swing_mode: str
+    beep_mode: str
+    humidity_sensor: str | None
+    backup_humidity_sensor: str | None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> _DisplayConfig:
+        """Build a snapshot from a device config or config entry data.
+        
+        Each value is coerced on its own, so one malformed setting falls back
+        to its default without affecting the others.
+        """
+        return cls(
+            heating_temperature=_coerce_config_value(
+                config, CONF_HEATING_TEMPERATURE, DEFAULT_HEATING_TEMPERATURE, float
+            ),
+            heating_warm_level=_coerce_config_value(
+                config, CONF_HEATING_WARM_LEVEL, DEFAULT_HEATING_WARM_LEVEL, int
+            ),
+            idle_fan_speed=_coerce_config_value(config, CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED, int),
+            idle_temperature=_coerce_config_value(
+                config, CONF_IDLE_TEMPERATURE, DEFAULT_IDLE_TEMPERATURE, float
+            ),
+            idle_warm_level=_coerce_config_value(config, CONF_IDLE_WARM_LEVEL, DEFAULT_IDLE_WARM_LEVEL, int),
+            swing_mode=config.get(CONF_SWING_MODE, DEFAULT_SWING_MODE),
+            beep_mode=config.get(CONF_BEEP_MODE, DEFAULT_BEEP_MODE),
+            humidity_sensor=config.get(CONF_HUMIDITY_SENSOR),
+            backup_humidity_sensor=config.get(CONF_BACKUP_HUMIDITY_SENSOR),
+        )
+
 
 class W100Coordinator(DataUpdateCoordinator):
     """Class to manage fetching W100 data with multi-device support."""
@@ -92,8 +328,26 @@ class W100Coordinator(DataUpdateCoordinator):
         """Initialize the coordinator."""
         self.entry = entry
         self.config = entry.data
-        self._created_thermostats: list[str] = []
+        # Primary W100 device name, refreshed in async_on_entry_update
+        self._device_name: str | None = entry.data.get(CONF_W100_DEVICE_NAME)
+        # Primary device state defaults, derived once from entry data
+        self._initial_fan_speed = _coerce_config_value(
+            entry.data, CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED, int
+        )
+        self._beep_enabled = entry.data.get(CONF_BEEP_MODE, DEFAULT_BEEP_MODE) != "Disable Beep"
+        self._update_thermostat_names()
+        # Insertion-ordered set: O(1) membership while keeping creation order
+        self._created_thermostats: dict[str, None] = {}
         self._thermostat_configs: dict[str, dict[str, Any]] = {}
+        # W100 climate entities registered for button routing, per device
+        self._device_climate_entities: dict[str, list[str]] = {}
+        # Entity registry, resolved lazily by the entity_registry property
+        self._entity_registry: er.EntityRegistry | None = None
+        # One state change listener shared by all created thermostats
+        self._thermostat_state_unsub: CALLBACK_TYPE | None = None
+        self._tracked_thermostats: frozenset[str] = frozenset()
+        # Last entity ID suffix used per thermostat base name
+        self._base_name_counter: dict[str, int] = {}
         self._storage = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_thermostats")
         
         # Enhanced logging context
@@ -111,11 +365,59 @@ class W100Coordinator(DataUpdateCoordinator):
         )
         
         # Multi-device state tracking - each device operates independently
-        self._device_states: dict[str, dict[str, Any]] = {}
+        self._device_states: dict[str, W100DeviceState] = {}
         self._device_configs: dict[str, dict[str, Any]] = {}
         self._device_thermostats: dict[str, list[str]] = {}  # device_name -> [thermostat_entity_ids]
         self._mqtt_subscriptions: dict[str, list[str]] = {}  # device_name -> [topic_list]
-        self._last_action_time: dict[str, datetime] = {}
+        self._mqtt_sub_states: dict[str, dict[str, Any]] = {}  # device_name -> subscription state
+        self._set_topics: dict[str, str] = {}  # device_name -> display set topic
+        self._last_action_time: dict[str, dict[str, float]] = {}  # device_name -> action -> monotonic seconds
+        # device_name -> resolved climate entity; cleared when configs/thermostats change
+        self._climate_entity_ids: dict[str, str | None] = {}
+        # device_name -> config values used by display sync; cleared with the above
+        self._display_configs: dict[str, _DisplayConfig] = {}
+        # (entity_id, hvac_modes) -> frozenset of supported modes for O(1) checks
+        self._supported_modes_cache: dict[tuple[str, tuple[str, ...]], frozenset[str]] = {}
+        # humidity sensor entity_id -> (last raw state, parsed value or None if invalid)
+        self._last_humidity_state: dict[str, tuple[str, float | None]] = {}
+        # humidity sensor entity_id -> clamped value, kept current by a state listener
+        self._humidity_cache: dict[str, float] = {}
+        self._humidity_sensors: set[str] = set()
+        self._humidity_unsub: CALLBACK_TYPE | None = None
+        
+        # Counts coordinator updates between periodic thermostat validations
+        self._validation_counter = 0
+        
+        # Pending coalesced listener update triggered by W100 state messages
+        self._pending_update_handle: CALLBACK_TYPE | None = None
+        # device_name -> (cancel handle, latest display payload) awaiting publish
+        self._pending_display_updates: dict[str, tuple[CALLBACK_TYPE, dict]] = {}
+        # device_name -> cancel handle of a scheduled display sync from thermostat changes
+        self._pending_display_syncs: dict[str, CALLBACK_TYPE] = {}
+        # In-flight display publish and sync tasks, cancelled on device removal and unload
+        self._display_publish_tasks: set[asyncio.Task] = set()
+        self._display_sync_tasks: set[asyncio.Task] = set()
+        # device_name -> latest payload queued for publish; dropped if the publish gives up
+        self._scheduled_display_payloads: dict[str, dict] = {}
+        
+        # Hash of the last processed state payload per device, to skip retransmits
+        self._last_payload_hash: dict[str, int] = {}
+        
+        # W100 button action handlers and per-action debounce times (default 0.5s)
+        self._action_dispatch = {
+            W100_ACTION_TOGGLE: self._async_handle_toggle_action,
+            W100_ACTION_PLUS: self._async_handle_plus_action,
+            W100_ACTION_MINUS: self._async_handle_minus_action,
+        }
+        # Display sync handler per climate HVAC mode; others use the default display
+        self._display_mode_handlers = {
+            "heat": self._sync_heat_mode_display,
+            "off": self._sync_off_mode_display,
+            "fan": self._sync_fan_mode_display,
+            "cool": self._sync_cool_mode_display,
+        }
+        # Longer debounce for toggle to prevent accidental double-toggles
+        self._debounce_times: dict[str, float] = {W100_ACTION_TOGGLE: 1.0}
         
         # Multi-device storage for persistence
         self._device_storage = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_devices")
@@ -162,7 +464,10 @@ class W100Coordinator(DataUpdateCoordinator):
             await self._async_setup_all_mqtt_listeners()
             
             # Initialize device states for all devices
-            await self._async_initialize_all_device_states()
+            self._init_all_device_states()
+            
+            # Track configured humidity sensors for display sync
+            self._async_refresh_humidity_listener()
             
         except W100IntegrationError:
             # Re-raise W100 specific errors
@@ -179,12 +484,10 @@ class W100Coordinator(DataUpdateCoordinator):
         """Fetch data from W100 device."""
         try:
             # Periodically validate thermostat entities (every 10 updates)
-            if not hasattr(self, '_validation_counter'):
-                self._validation_counter = 0
-            
             self._validation_counter += 1
             if self._validation_counter >= 10:
                 self._validation_counter = 0
+            if self._validation_counter == 0 and self._created_thermostats:
                 # Run validation in background to avoid blocking the update
                 self.hass.async_create_task(self.async_cleanup_invalid_thermostats())
             
@@ -210,14 +513,14 @@ class W100Coordinator(DataUpdateCoordinator):
                 # Display sync failures are non-critical
             
             # Return current state data
-            device_name = self.config.get(CONF_W100_DEVICE_NAME, "unknown")
+            device_name = self._device_name or "unknown"
             device_state = self._device_states.get(device_name, {})
             
             return {
                 "device_name": device_name,
                 "device_state": device_state,
                 "status": "connected" if device_state else "disconnected",
-                "last_update": datetime.now(),
+                "last_update": dt_util.utcnow(),
                 "created_thermostats": len(self._created_thermostats),
                 "device_states": self._device_states.copy(),
             }
@@ -236,6 +539,7 @@ class W100Coordinator(DataUpdateCoordinator):
             if data:
                 self._device_configs = data.get("device_configs", {})
                 self._device_thermostats = data.get("device_thermostats", {})
+                self._invalidate_device_caches()
                 _LOGGER.debug(
                     "Loaded %d device configurations from storage for entry %s",
                     len(self._device_configs),
@@ -259,6 +563,7 @@ class W100Coordinator(DataUpdateCoordinator):
             )
             self._device_configs = {}
             self._device_thermostats = {}
+            self._invalidate_device_caches()
             # Try to migrate from single device config
             await self._async_migrate_single_device_config()
 
@@ -293,6 +598,7 @@ class W100Coordinator(DataUpdateCoordinator):
                 # Initialize device thermostat tracking
                 if device_name not in self._device_thermostats:
                     self._device_thermostats[device_name] = []
+                self._invalidate_device_caches()
                 
                 # Save migrated data
                 await self._async_save_device_data()
@@ -307,8 +613,9 @@ class W100Coordinator(DataUpdateCoordinator):
         try:
             data = await self._storage.async_load()
             if data:
-                self._created_thermostats = data.get("created_thermostats", [])
+                self._created_thermostats = dict.fromkeys(data.get("created_thermostats", []))
                 self._thermostat_configs = data.get("thermostat_configs", {})
+                self._invalidate_device_caches()
                 _LOGGER.debug(
                     "Loaded %d thermostats from storage for entry %s",
                     len(self._created_thermostats),
@@ -316,17 +623,30 @@ class W100Coordinator(DataUpdateCoordinator):
                 )
         except Exception as err:
             _LOGGER.warning("Failed to load thermostat data: %s", err)
-            self._created_thermostats = []
+            self._created_thermostats = {}
             self._thermostat_configs = {}
 
+    @callback
+    def _async_refresh_thermostat_listener(self) -> None:
+        """Track state changes of every created thermostat with one listener."""
+        thermostats = frozenset(self._created_thermostats)
+        if thermostats == self._tracked_thermostats:
+            return
+        
+        if self._thermostat_state_unsub is not None:
+            self._thermostat_state_unsub()
+            self._thermostat_state_unsub = None
+        self._tracked_thermostats = thermostats
+        
+        if thermostats:
+            self._thermostat_state_unsub = async_track_state_change_event(
+                self.hass, list(thermostats), self._async_thermostat_state_changed
+            )
+
     async def _async_setup_thermostat_listeners(self) -> None:
         """Set up state change listeners for created thermostats."""
         try:
-            for entity_id in self._created_thermostats:
-                self.hass.helpers.event.async_track_state_change_event(
-                    entity_id,
-                    self._async_thermostat_state_changed
-                )
+            self._async_refresh_thermostat_listener()
             
             _LOGGER.debug("Set up state listeners for %d thermostats", len(self._created_thermostats))
             
@@ -337,19 +657,21 @@ class W100Coordinator(DataUpdateCoordinator):
     def _async_thermostat_state_changed(self, event) -> None:
         """Handle thermostat state changes."""
         try:
-            entity_id = event.data.get("entity_id")
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
+            data = event.data
+            entity_id = data.get("entity_id")
+            new_state = data.get("new_state")
             
-            if not entity_id or not new_state:
+            if not entity_id or new_state is None:
                 return
             
-            _LOGGER.debug(
-                "Thermostat %s state changed from %s to %s",
-                entity_id,
-                old_state.state if old_state else "unknown",
-                new_state.state
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                old_state = data.get("old_state")
+                _LOGGER.debug(
+                    "Thermostat %s state changed from %s to %s",
+                    entity_id,
+                    old_state.state if old_state else "unknown",
+                    new_state.state
+                )
             
             # Trigger display sync when thermostat state changes
             # Find which device this thermostat belongs to
@@ -361,12 +683,10 @@ class W100Coordinator(DataUpdateCoordinator):
             
             # Fallback to primary device if not found in device thermostats
             if not device_name:
-                device_name = self.config.get(CONF_W100_DEVICE_NAME)
+                device_name = self._device_name
             
             if device_name:
-                self.hass.async_create_task(
-                    self.async_sync_w100_display(device_name)
-                )
+                self._schedule_display_sync(device_name)
             
         except Exception as err:
             _LOGGER.error("Error handling thermostat state change: %s", err)
@@ -374,7 +694,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def async_cleanup_invalid_thermostats(self) -> None:
         """Clean up invalid or orphaned thermostats."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             invalid_thermostats = []
             
             for entity_id in self._created_thermostats:
@@ -388,16 +708,32 @@ class W100Coordinator(DataUpdateCoordinator):
                 if not state:
                     invalid_thermostats.append(entity_id)
             
-            # Remove invalid thermostats
+            # Remove invalid thermostats from the registry; failed ones stay tracked
+            removed: set[str] = set()
             for entity_id in invalid_thermostats:
                 try:
-                    await self.async_remove_generic_thermostat(entity_id)
-                    _LOGGER.info("Cleaned up invalid thermostat: %s", entity_id)
+                    await self._async_remove_thermostat_entity(entity_id)
                 except Exception as err:
                     _LOGGER.error("Failed to clean up invalid thermostat %s: %s", entity_id, err)
-            
-            if invalid_thermostats:
-                _LOGGER.info("Cleaned up %d invalid thermostats", len(invalid_thermostats))
+                    continue
+                removed.add(entity_id)
+                _LOGGER.info("Cleaned up invalid thermostat: %s", entity_id)
+            
+            if removed:
+                # Drop all removed thermostats from tracking in one pass, then persist once
+                for entity_id in removed:
+                    self._created_thermostats.pop(entity_id, None)
+                    self._thermostat_configs.pop(entity_id, None)
+                for thermostats in self._device_thermostats.values():
+                    thermostats[:] = [
+                        entity_id for entity_id in thermostats if entity_id not in removed
+                    ]
+                self._async_refresh_thermostat_listener()
+                self._invalidate_device_caches()
+                
+                self._schedule_thermostat_save()
+                await self._async_save_device_data()
+                _LOGGER.info("Cleaned up %d invalid thermostats", len(removed))
             
         except Exception as err:
             _LOGGER.error("Failed to cleanup invalid thermostats: %s", err)
@@ -414,14 +750,26 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to save device data: %s", err)
 
+    @callback
+    def _thermostat_data(self) -> dict[str, Any]:
+        """Return thermostat data in its storage format."""
+        return {
+            "created_thermostats": list(self._created_thermostats),
+            "thermostat_configs": self._thermostat_configs,
+        }
+
+    @callback
+    def _schedule_thermostat_save(self) -> None:
+        """Coalesce thermostat data writes into one delayed save.
+        
+        Store flushes a pending delayed save on Home Assistant shutdown.
+        """
+        self._storage.async_delay_save(self._thermostat_data, THERMOSTAT_SAVE_DELAY_SECONDS)
+
     async def _async_save_thermostat_data(self) -> None:
-        """Save thermostat data to storage."""
+        """Save thermostat data to storage immediately."""
         try:
-            data = {
-                "created_thermostats": self._created_thermostats,
-                "thermostat_configs": self._thermostat_configs,
-            }
-            await self._storage.async_save(data)
+            await self._storage.async_save(self._thermostat_data())
             _LOGGER.debug("Saved thermostat data to storage")
         except Exception as err:
             _LOGGER.error("Failed to save thermostat data: %s", err)
@@ -452,7 +800,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def async_register_proxy_climate_entity(self, device_name: str, entity_id: str) -> None:
         """Register proxy climate entity with proper unique ID and logical device linking."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             device_registry = dr.async_get(self.hass)
             
             # Find or create the logical device entry for integration entities
@@ -507,7 +855,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def async_register_sensor_entity(self, device_name: str, entity_id: str, sensor_type: str) -> None:
         """Register sensor entity with proper unique ID and logical device linking."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             device_registry = dr.async_get(self.hass)
             
             # Find or create the logical device entry for integration entities
@@ -573,7 +921,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def async_register_switch_entity(self, device_name: str, entity_id: str, switch_type: str) -> None:
         """Register switch entity with proper unique ID and logical device linking."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             device_registry = dr.async_get(self.hass)
             
             # Find or create the logical device entry for integration entities
@@ -639,14 +987,14 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_cleanup_orphaned_thermostats(self) -> None:
         """Clean up orphaned thermostats that exist in registry but not in our tracking."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             device_registry = dr.async_get(self.hass)
             
             # Find all entities associated with this integration entry
             integration_entities = [
-                entry for entry in entity_registry.entities.values()
-                if entry.config_entry_id == self.entry.entry_id
-                and entry.entity_id.startswith("climate.")
+                entry
+                for entry in er.async_entries_for_config_entry(entity_registry, self.entry.entry_id)
+                if entry.entity_id.startswith("climate.")
             ]
             
             orphaned_entities = []
@@ -656,8 +1004,7 @@ class W100Coordinator(DataUpdateCoordinator):
                 # Check if this is a thermostat we created but lost track of
                 if (entity_id not in self._created_thermostats and 
                     entity_entry.original_name and 
-                    "W100" in entity_entry.original_name and 
-                    "Thermostat" in entity_entry.original_name):
+                    _W100_THERMOSTAT_NAME_RE.search(entity_entry.original_name)):
                     
                     orphaned_entities.append(entity_id)
                     _LOGGER.warning("Found orphaned thermostat: %s", entity_id)
@@ -685,7 +1032,7 @@ class W100Coordinator(DataUpdateCoordinator):
         Raises:
             HomeAssistantError: If thermostat creation fails
         """
-        w100_device_name = self.config.get("w100_device_name", "w100")
+        w100_device_name = self._thermostat_device_name
         thermostat_context = {
             "device_name": w100_device_name,
             "operation": "thermostat_creation",
@@ -702,12 +1049,13 @@ class W100Coordinator(DataUpdateCoordinator):
             # Extract configuration with defaults
             heater_entity = config.get(CONF_HEATER_SWITCH)
             target_sensor = config.get(CONF_TEMPERATURE_SENSOR)
-            min_temp = config.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
-            max_temp = config.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
-            target_temp = config.get(CONF_TARGET_TEMP, DEFAULT_TARGET_TEMP)
-            cold_tolerance = config.get(CONF_COLD_TOLERANCE, DEFAULT_COLD_TOLERANCE)
-            hot_tolerance = config.get(CONF_HOT_TOLERANCE, DEFAULT_HOT_TOLERANCE)
-            precision = config.get(CONF_PRECISION, DEFAULT_PRECISION)
+            merged = {**_THERMOSTAT_DEFAULTS, **config}
+            min_temp = merged[CONF_MIN_TEMP]
+            max_temp = merged[CONF_MAX_TEMP]
+            target_temp = merged[CONF_TARGET_TEMP]
+            cold_tolerance = merged[CONF_COLD_TOLERANCE]
+            hot_tolerance = merged[CONF_HOT_TOLERANCE]
+            precision = merged[CONF_PRECISION]
             
             _LOGGER.debug(
                 "Thermostat configuration for device '%s': heater=%s, sensor=%s, temp_range=%.1f-%.1f°C",
@@ -720,17 +1068,16 @@ class W100Coordinator(DataUpdateCoordinator):
             )
             
             # Validate required entities exist
-            if not self.hass.states.get(heater_entity):
+            states = self.hass.states
+            if states.get(heater_entity) is None:
                 raise HomeAssistantError(f"Heater entity {heater_entity} not found")
             
-            if not self.hass.states.get(target_sensor):
+            if states.get(target_sensor) is None:
                 raise HomeAssistantError(f"Temperature sensor {target_sensor} not found")
             
             # Generate unique entity ID and name
-            w100_device_name = self.config.get("w100_device_name", "w100")
-            base_name = f"w100_{self._sanitize_name(w100_device_name)}_thermostat"
-            entity_id = await self._generate_unique_entity_id(base_name)
-            friendly_name = f"W100 {w100_device_name.replace('_', ' ').title()} Thermostat"
+            entity_id = await self._generate_unique_entity_id(self._thermostat_base_name)
+            friendly_name = f"W100 {self._thermostat_title} Thermostat"
             
             # Ensure precision is compatible with W100 (0.5°C increments)
             if precision != 0.5:
@@ -752,29 +1099,28 @@ class W100Coordinator(DataUpdateCoordinator):
                 "hot_tolerance": hot_tolerance,
                 "precision": precision,
                 "initial_hvac_mode": "off",
-                "unique_id": f"{DOMAIN}_{entity_id}",
+                # Interned: used repeatedly as a registry/dict key downstream
+                "unique_id": sys.intern(f"{DOMAIN}_{entity_id}"),
             }
             
             # Create the generic thermostat entity
             await self._async_create_thermostat_entity(entity_id, thermostat_config)
             
             # Track created thermostat for cleanup
-            self._created_thermostats.append(entity_id)
+            self._created_thermostats[entity_id] = None
             
             # Associate thermostat with device
             device_name = self.config.get(CONF_W100_DEVICE_NAME, "unknown")
             if device_name not in self._device_thermostats:
                 self._device_thermostats[device_name] = []
             self._device_thermostats[device_name].append(entity_id)
+            self._invalidate_device_caches()
             
-            # Set up state change listener for the new thermostat
-            self.hass.helpers.event.async_track_state_change_event(
-                entity_id,
-                self._async_thermostat_state_changed
-            )
+            # Add the new thermostat to the shared state change listener
+            self._async_refresh_thermostat_listener()
             
             # Save thermostat and device data to persistent storage
-            await self._async_save_thermostat_data()
+            self._schedule_thermostat_save()
             await self._async_save_device_data()
             
             _LOGGER.info(
@@ -832,18 +1178,20 @@ class W100Coordinator(DataUpdateCoordinator):
             # Extract configuration with defaults
             heater_entity = config.get(CONF_HEATER_SWITCH)
             target_sensor = config.get(CONF_TEMPERATURE_SENSOR)
-            min_temp = config.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
-            max_temp = config.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
-            target_temp = config.get(CONF_TARGET_TEMP, DEFAULT_TARGET_TEMP)
-            cold_tolerance = config.get(CONF_COLD_TOLERANCE, DEFAULT_COLD_TOLERANCE)
-            hot_tolerance = config.get(CONF_HOT_TOLERANCE, DEFAULT_HOT_TOLERANCE)
-            precision = config.get(CONF_PRECISION, DEFAULT_PRECISION)
+            merged = {**_THERMOSTAT_DEFAULTS, **config}
+            min_temp = merged[CONF_MIN_TEMP]
+            max_temp = merged[CONF_MAX_TEMP]
+            target_temp = merged[CONF_TARGET_TEMP]
+            cold_tolerance = merged[CONF_COLD_TOLERANCE]
+            hot_tolerance = merged[CONF_HOT_TOLERANCE]
+            precision = merged[CONF_PRECISION]
             
             # Validate required entities exist
-            if not self.hass.states.get(heater_entity):
+            states = self.hass.states
+            if states.get(heater_entity) is None:
                 raise HomeAssistantError(f"Heater entity {heater_entity} not found")
             
-            if not self.hass.states.get(target_sensor):
+            if states.get(target_sensor) is None:
                 raise HomeAssistantError(f"Temperature sensor {target_sensor} not found")
             
             # Generate unique entity ID and name for this device
@@ -871,7 +1219,7 @@ class W100Coordinator(DataUpdateCoordinator):
                 "hot_tolerance": hot_tolerance,
                 "precision": precision,
                 "initial_hvac_mode": "off",
-                "unique_id": f"{DOMAIN}_{device_name}_{entity_id}",
+                "unique_id": sys.intern(f"{DOMAIN}_{device_name}_{entity_id}"),
                 "device_name": device_name,
             }
             
@@ -879,21 +1227,19 @@ class W100Coordinator(DataUpdateCoordinator):
             await self._async_create_thermostat_entity(entity_id, thermostat_config)
             
             # Track created thermostat for cleanup
-            self._created_thermostats.append(entity_id)
+            self._created_thermostats[entity_id] = None
             
             # Associate thermostat with specific device
             if device_name not in self._device_thermostats:
                 self._device_thermostats[device_name] = []
             self._device_thermostats[device_name].append(entity_id)
+            self._invalidate_device_caches()
             
-            # Set up state change listener for the new thermostat
-            self.hass.helpers.event.async_track_state_change_event(
-                entity_id,
-                self._async_thermostat_state_changed
-            )
+            # Add the new thermostat to the shared state change listener
+            self._async_refresh_thermostat_listener()
             
             # Save thermostat and device data to persistent storage
-            await self._async_save_thermostat_data()
+            self._schedule_thermostat_save()
             await self._async_save_device_data()
             
             _LOGGER.info(
@@ -908,29 +1254,38 @@ class W100Coordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to create generic thermostat for device %s: %s", device_name, err)
             raise HomeAssistantError(f"Failed to create generic thermostat for device {device_name}: {err}") from err
 
-    def _sanitize_name(self, name: str) -> str:
+    @callback
+    def _update_thermostat_names(self) -> None:
+        """Derive primary-device thermostat naming strings from the entry config."""
+        self._thermostat_device_name: str = self.config.get(CONF_W100_DEVICE_NAME, "w100")
+        self._thermostat_base_name = f"w100_{self._sanitize_name(self._thermostat_device_name)}_thermostat"
+        self._thermostat_title = self._thermostat_device_name.replace('_', ' ').title()
+
+    @staticmethod
+    def _sanitize_name(name: str) -> str:
         """Sanitize a name for use in entity IDs."""
         # Convert to lowercase and replace non-alphanumeric characters with underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9]', '_', name.lower())
+        sanitized = _NON_ALNUM_RE.sub('_', name.lower())
         # Remove multiple consecutive underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
         # Remove leading/trailing underscores
         return sanitized.strip('_')
 
     async def _generate_unique_entity_id(self, base_name: str) -> str:
         """Generate a unique entity ID for the thermostat."""
-        entity_registry = er.async_get(self.hass)
+        entity_registry = self.entity_registry
         
-        # Start with the base name
-        entity_id = f"climate.{base_name}"
-        counter = 1
+        # Resume from the last suffix handed out for this base name (0 = bare name)
+        counter = self._base_name_counter.get(base_name, 0)
+        entity_id = f"climate.{base_name}_{counter}" if counter else f"climate.{base_name}"
         
         # Check if entity ID already exists in registry or in our created list
         while (entity_registry.async_get(entity_id) is not None or 
                entity_id in self._created_thermostats):
-            entity_id = f"climate.{base_name}_{counter}"
             counter += 1
+            entity_id = f"climate.{base_name}_{counter}"
         
+        self._base_name_counter[base_name] = counter
         return entity_id
 
     async def _async_create_thermostat_entity(self, entity_id: str, config: dict[str, Any]) -> None:
@@ -943,14 +1298,9 @@ class W100Coordinator(DataUpdateCoordinator):
             # Create logical device entry for the thermostat
             device_id = await self._async_create_thermostat_logical_device(entity_id, config)
             
-            # Get the generic_thermostat platform
-            platform = None
-            for platform_info in async_get_platforms(self.hass, GENERIC_THERMOSTAT_DOMAIN):
-                if platform_info.domain == GENERIC_THERMOSTAT_DOMAIN:
-                    platform = platform_info.platform
-                    break
-            
-            if platform is None:
+            # async_get_platforms is already keyed by integration name, so any
+            # result means the generic_thermostat platform is loaded
+            if not async_get_platforms(self.hass, GENERIC_THERMOSTAT_DOMAIN):
                 # If platform is not loaded, we need to set up the configuration
                 # This will be handled by Home Assistant's configuration system
                 _LOGGER.debug("Generic thermostat platform not loaded, creating configuration entry")
@@ -971,13 +1321,17 @@ class W100Coordinator(DataUpdateCoordinator):
         """Create logical device entry for the thermostat with proper registry integration."""
         try:
             device_registry = dr.async_get(self.hass)
-            w100_device_name = config.get("device_name", self.config.get("w100_device_name", "w100"))
+            w100_device_name = config.get("device_name")
+            title = (
+                w100_device_name.replace('_', ' ').title()
+                if w100_device_name else self._thermostat_title
+            )
             
             # Create logical device entry for thermostat (not physical device)
             device_entry = device_registry.async_get_or_create(
                 config_entry_id=self.entry.entry_id,
-                identifiers={(DOMAIN, f"w100_thermostat_{entity_id}")},
-                name=config.get("name", f"W100 Thermostat for {w100_device_name.replace('_', ' ').title()}"),
+                identifiers={(DOMAIN, sys.intern(f"w100_thermostat_{entity_id}"))},
+                name=config.get("name", f"W100 Thermostat for {title}"),
                 manufacturer="W100 Smart Control Integration",
                 model="Generic Thermostat Controller",
                 sw_version="1.0.0",
@@ -999,9 +1353,6 @@ class W100Coordinator(DataUpdateCoordinator):
         _LOGGER.debug("Setting up thermostat configuration for %s with device %s", entity_id, device_id)
         
         # Store the thermostat configuration in the coordinator
-        if not hasattr(self, '_thermostat_configs'):
-            self._thermostat_configs = {}
-        
         # Add device_id to config for entity registry integration
         config_with_device = {**config, "device_id": device_id}
         self._thermostat_configs[entity_id] = config_with_device
@@ -1014,9 +1365,6 @@ class W100Coordinator(DataUpdateCoordinator):
         _LOGGER.debug("Setting up thermostat entity %s with device %s", entity_id, device_id)
         
         # Store the thermostat configuration for later use
-        if not hasattr(self, '_thermostat_configs'):
-            self._thermostat_configs = {}
-        
         # Add device_id to config for entity registry integration
         config_with_device = {**config, "device_id": device_id}
         self._thermostat_configs[entity_id] = config_with_device
@@ -1027,7 +1375,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_register_thermostat_entity(self, entity_id: str, config: dict[str, Any]) -> None:
         """Register thermostat entity in the entity registry with proper device linking."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             
             # Create entity registry entry with comprehensive information
             entity_entry = entity_registry.async_get_or_create(
@@ -1060,18 +1408,19 @@ class W100Coordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to register thermostat entity %s: %s", entity_id, err)
             raise
 
-    async def async_remove_generic_thermostat(self, entity_id: str) -> None:
+    async def async_remove_generic_thermostat(self, entity_id: str, defer_save: bool = False) -> None:
         """Remove a created generic thermostat.
         
         Args:
             entity_id: The entity ID of the thermostat to remove
+            defer_save: Skip persisting; the caller saves once after a batch of removals
         """
         try:
             await self._async_remove_thermostat_entity(entity_id)
             
             # Remove from our tracking
-            if entity_id in self._created_thermostats:
-                self._created_thermostats.remove(entity_id)
+            self._created_thermostats.pop(entity_id, None)
+            self._async_refresh_thermostat_listener()
             
             # Remove from device thermostat tracking
             for device_name, thermostats in self._device_thermostats.items():
@@ -1081,12 +1430,14 @@ class W100Coordinator(DataUpdateCoordinator):
                     break
             
             # Remove configuration if stored
-            if entity_id in self._thermostat_configs:
-                del self._thermostat_configs[entity_id]
+            self._thermostat_configs.pop(entity_id, None)
+            
+            self._invalidate_device_caches()
             
             # Save updated data to storage
-            await self._async_save_thermostat_data()
-            await self._async_save_device_data()
+            if not defer_save:
+                self._schedule_thermostat_save()
+                await self._async_save_device_data()
             
             _LOGGER.info("Removed generic thermostat %s", entity_id)
                 
@@ -1097,7 +1448,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_remove_thermostat_entity(self, entity_id: str) -> None:
         """Remove thermostat entity from registry and disable it."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             entity_entry = entity_registry.async_get(entity_id)
             
             if entity_entry:
@@ -1107,9 +1458,6 @@ class W100Coordinator(DataUpdateCoordinator):
                     disabled_by=er.RegistryEntryDisabler.INTEGRATION
                 )
                 
-                # Wait a moment for the entity to be disabled
-                await self.hass.async_add_executor_job(lambda: None)
-                
                 # Remove from entity registry
                 entity_registry.async_remove(entity_id)
                 _LOGGER.debug("Removed thermostat entity %s from registry", entity_id)
@@ -1129,14 +1477,13 @@ class W100Coordinator(DataUpdateCoordinator):
             return
             
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             device_registry = dr.async_get(self.hass)
             
             # Check if device has any remaining entities
-            device_entities = [
-                entry for entry in entity_registry.entities.values()
-                if entry.device_id == device_id
-            ]
+            device_entities = er.async_entries_for_device(
+                entity_registry, device_id, include_disabled_entities=True
+            )
             
             # If no entities remain and device was created by this integration, remove it
             if not device_entities:
@@ -1166,15 +1513,17 @@ class W100Coordinator(DataUpdateCoordinator):
             heater_entity = config.get(CONF_HEATER_SWITCH)
             target_sensor = config.get(CONF_TEMPERATURE_SENSOR)
             
-            if heater_entity and not self.hass.states.get(heater_entity):
+            states = self.hass.states
+            if heater_entity and states.get(heater_entity) is None:
                 raise HomeAssistantError(f"Heater entity {heater_entity} not found")
             
-            if target_sensor and not self.hass.states.get(target_sensor):
+            if target_sensor and states.get(target_sensor) is None:
                 raise HomeAssistantError(f"Temperature sensor {target_sensor} not found")
             
             # Update stored configuration
             old_config = self._thermostat_configs.get(entity_id, {})
-            updated_config = {**old_config, **config}
+            updated_config = dict(old_config)
+            updated_config.update(config)
             
             # Ensure precision is compatible with W100 (0.5°C increments)
             precision = updated_config.get(CONF_PRECISION, DEFAULT_PRECISION)
@@ -1200,7 +1549,7 @@ class W100Coordinator(DataUpdateCoordinator):
                 await self._async_update_thermostat_entity(entity_id, updated_config)
             
             # Save updated configuration to storage
-            await self._async_save_thermostat_data()
+            self._schedule_thermostat_save()
             
             _LOGGER.info("Updated generic thermostat %s configuration", entity_id)
             
@@ -1208,15 +1557,13 @@ class W100Coordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to update generic thermostat %s: %s", entity_id, err)
             raise HomeAssistantError(f"Failed to update generic thermostat: {err}") from err
 
-    def _check_critical_config_changes(self, old_config: dict[str, Any], new_config: dict[str, Any]) -> bool:
+    @staticmethod
+    def _check_critical_config_changes(old_config: dict[str, Any], new_config: dict[str, Any]) -> bool:
         """Check if configuration changes require thermostat recreation."""
-        critical_keys = ["heater", "target_sensor", "unique_id"]
-        
-        for key in critical_keys:
-            if old_config.get(key) != new_config.get(key):
-                return True
-        
-        return False
+        return (
+            tuple(map(old_config.get, _CRITICAL_THERMOSTAT_KEYS))
+            != tuple(map(new_config.get, _CRITICAL_THERMOSTAT_KEYS))
+        )
 
     async def _async_recreate_thermostat(self, entity_id: str, config: dict[str, Any]) -> None:
         """Recreate a thermostat with new configuration."""
@@ -1224,8 +1571,8 @@ class W100Coordinator(DataUpdateCoordinator):
             # Remove the old thermostat
             await self._async_remove_thermostat_entity(entity_id)
             
-            # Wait a moment for cleanup
-            await asyncio.sleep(1)
+            # Yield one loop tick so registry removal listeners run before re-adding
+            await asyncio.sleep(0)
             
             # Create new thermostat with updated configuration
             device_id = config.get("device_id")
@@ -1238,11 +1585,8 @@ class W100Coordinator(DataUpdateCoordinator):
             # Update stored configuration
             self._thermostat_configs[entity_id] = config
             
-            # Set up state listener for the recreated thermostat
-            self.hass.helpers.event.async_track_state_change_event(
-                entity_id,
-                self._async_thermostat_state_changed
-            )
+            # The shared listener keys on entity ID, so it already covers the recreated thermostat
+            self._async_refresh_thermostat_listener()
             
             _LOGGER.info("Successfully recreated thermostat %s", entity_id)
             
@@ -1253,7 +1597,7 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_update_thermostat_entity(self, entity_id: str, config: dict[str, Any]) -> None:
         """Update thermostat entity with new configuration."""
         try:
-            entity_registry = er.async_get(self.hass)
+            entity_registry = self.entity_registry
             entity_entry = entity_registry.async_get(entity_id)
             
             if entity_entry:
@@ -1353,102 +1697,259 @@ class W100Coordinator(DataUpdateCoordinator):
             
             # Set up action listener
             action_topic = MQTT_W100_ACTION_TOPIC.format(device_name)
+            self._set_topics[device_name] = sys.intern(MQTT_W100_SET_TOPIC.format(device_name))
             
             @callback
             def handle_w100_action(msg: ReceiveMessage) -> None:
                 """Handle W100 action messages."""
                 try:
                     action = msg.payload
-                    _LOGGER.debug("Received W100 action: %s from device %s", action, device_name)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Received W100 action: %s from device %s", action, device_name)
                     
                     # Validate action
-                    if action not in [W100_ACTION_TOGGLE, W100_ACTION_PLUS, W100_ACTION_MINUS]:
+                    if action not in _W100_VALID_ACTIONS:
                         _LOGGER.debug("Unknown W100 action received from %s: %s", device_name, action)
                         return
                     
-                    # Schedule action handling
+                    # Debounce and validate inline; only accepted presses that
+                    # need to call services pay for a task
+                    accepted = self._async_accept_w100_action(action, device_name)
+                    if accepted is None:
+                        return
                     self.hass.async_create_task(
-                        self.async_handle_w100_action(action, device_name)
+                        self._async_run_w100_action(action, device_name, *accepted)
                     )
                 except Exception as err:
                     _LOGGER.error("Error handling W100 action message from %s: %s", device_name, err)
             
-            # Subscribe to action topic
-            await mqtt.async_subscribe(self.hass, action_topic, handle_w100_action, 0)
-            self._mqtt_subscriptions[device_name].append(action_topic)
-            _LOGGER.debug("Subscribed to W100 action topic: %s", action_topic)
-            
             # Set up state listener
             state_topic = MQTT_W100_STATE_TOPIC.format(device_name)
             
+            # handle_w100_state runs inline in the MQTT message loop and must stay
+            # synchronous: no awaits and no per-message task creation. Listener
+            # fan-out is coalesced via _schedule_coordinator_update. Anything that
+            # ever needs to await should be fed to a single consumer task through
+            # an asyncio.Queue instead of spawning a task per message.
             @callback
             def handle_w100_state(msg: ReceiveMessage) -> None:
                 """Handle W100 state messages."""
                 try:
                     if not msg.payload:
                         return
+                    
+                    # W100 periodically re-publishes identical state; skip parsing
+                    # those but still record that the device was seen
+                    payload_hash = hash(msg.payload)
+                    if self._last_payload_hash.get(device_name) == payload_hash:
+                        device_state = self._device_states.get(device_name)
+                        if device_state is not None:
+                            device_state.last_seen = dt_util.utcnow()
+                        return
                         
-                    payload = json.loads(msg.payload)
-                    _LOGGER.debug("Received W100 state: %s from device %s", payload, device_name)
+                    payload = _json_loads(msg.payload)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Received W100 state: %s from device %s", payload, device_name)
                     
                     # Update device state with validation
                     if device_name not in self._device_states:
-                        self._device_states[device_name] = {}
+                        self._device_states[device_name] = W100DeviceState(device_name=device_name)
                     
                     # Only update with valid state data
-                    valid_keys = ["temperature", "humidity", "battery", "linkquality", "voltage"]
                     filtered_payload = {
-                        key: value for key, value in payload.items() 
-                        if key in valid_keys and value is not None
+                        key: value for key, value in payload.items()
+                        if value is not None and key in _W100_STATE_VALID_KEYS
                     }
                     
                     if filtered_payload:
-                        self._device_states[device_name].update({
-                            **filtered_payload,
-                            "last_seen": datetime.now(),
-                        })
+                        device_state = self._device_states[device_name]
+                        device_state.update(filtered_payload)
+                        device_state.last_seen = dt_util.utcnow()
+                        
+                        # Trigger (coalesced) coordinator update
+                        self._schedule_coordinator_update()
                         
-                        # Trigger coordinator update
-                        self.async_set_updated_data(self.data)
+                        self._last_payload_hash[device_name] = payload_hash
                     
-                except json.JSONDecodeError as err:
+                except _JSON_DECODE_ERRORS as err:
                     _LOGGER.warning("Invalid JSON in W100 state message from %s: %s", device_name, err)
                 except Exception as err:
                     _LOGGER.error("Error handling W100 state message from %s: %s", device_name, err)
             
-            # Subscribe to state topic
-            await mqtt.async_subscribe(self.hass, state_topic, handle_w100_state, 0)
-            self._mqtt_subscriptions[device_name].append(state_topic)
-            _LOGGER.debug("Subscribed to W100 state topic: %s", state_topic)
+            # Subscribe to action and state topics in one batched registration;
+            # passing the previous state replaces rather than duplicates subscriptions
+            sub_state = async_prepare_subscribe_topics(
+                self.hass,
+                self._mqtt_sub_states.get(device_name),
+                {
+                    "w100_action": {
+                        "topic": action_topic,
+                        "msg_callback": handle_w100_action,
+                        "qos": 0,
+                    },
+                    "w100_state": {
+                        "topic": state_topic,
+                        "msg_callback": handle_w100_state,
+                        "qos": 0,
+                    },
+                },
+            )
+            await async_subscribe_topics(self.hass, sub_state)
+            self._mqtt_sub_states[device_name] = sub_state
+            self._mqtt_subscriptions[device_name] = [action_topic, state_topic]
+            _LOGGER.debug("Subscribed to W100 topics: %s, %s", action_topic, state_topic)
             
             _LOGGER.info("Successfully set up MQTT listeners for W100 device: %s", device_name)
             
         except Exception as err:
             _LOGGER.error("Failed to set up MQTT listeners for W100 device %s: %s", device_name, err)
 
+    @callback
+    def _schedule_coordinator_update(self) -> None:
+        """Schedule a coalesced listener update for bursts of W100 state messages."""
+        if self._pending_update_handle is None:
+            self._pending_update_handle = async_call_later(
+                self.hass, STATE_UPDATE_COALESCE_SECONDS, self._flush_update
+            )
+
+    @callback
+    def _flush_update(self, _now: datetime) -> None:
+        """Push the coalesced state update to coordinator listeners."""
+        self._pending_update_handle = None
+        self.async_set_updated_data(self.data)
+
+    @callback
+    def _schedule_display_update(self, device_name: str, display_payload: dict) -> None:
+        """Schedule a coalesced display publish for a W100 device.
+        
+        Payloads are complete display states, so a newer payload for the same
+        device replaces a pending one instead of causing a second publish. A
+        payload matching the last one queued (pending, in flight or published)
+        is dropped, which covers every publish path.
+        """
+        if self._display_payload_unchanged(
+            self._scheduled_display_payloads.get(device_name), display_payload
+        ):
+            _LOGGER.debug("W100 display for %s already queued with this payload, skipping", device_name)
+            return
+        self._scheduled_display_payloads[device_name] = display_payload
+        
+        pending = self._pending_display_updates.get(device_name)
+        if pending is not None:
+            self._pending_display_updates[device_name] = (pending[0], display_payload)
+            return
+        
+        cancel = async_call_later(
+            self.hass,
+            DISPLAY_PUBLISH_COALESCE_SECONDS,
+            partial(self._flush_display_update, device_name),
+        )
+        self._pending_display_updates[device_name] = (cancel, display_payload)
+
+    @callback
+    def _flush_display_update(self, device_name: str, _now: datetime) -> None:
+        """Publish the latest pending display payload for a W100 device."""
+        pending = self._pending_display_updates.pop(device_name, None)
+        if pending is None:
+            return
+        # A publish still retrying for this device carries an older payload;
+        # letting it land after this one would leave the display stale
+        task_name = f"w100_display_publish_{device_name}"
+        for task in self._display_publish_tasks:
+            if task.get_name() == task_name:
+                task.cancel()
+        self._track_display_task(
+            self._display_publish_tasks,
+            self._async_send_display_update(device_name, pending[1]),
+            task_name,
+        )
+
+    @callback
+    def _track_display_task(
+        self, tasks: set[asyncio.Task], target: Coroutine[Any, Any, None], name: str
+    ) -> None:
+        """Create a named display task kept in tasks until it finishes."""
+        task = self.hass.async_create_task(target, name=name)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    @callback
+    def _schedule_display_sync(self, device_name: str) -> None:
+        """Schedule a coalesced display sync for a W100 device.
+        
+        A sync reads the current climate state when it runs, so further
+        thermostat changes while one is pending need no extra sync.
+        """
+        if device_name in self._pending_display_syncs:
+            return
+        self._pending_display_syncs[device_name] = async_call_later(
+            self.hass,
+            DISPLAY_SYNC_COALESCE_SECONDS,
+            partial(self._flush_display_sync, device_name),
+        )
+
+    @callback
+    def _flush_display_sync(self, device_name: str, _now: datetime) -> None:
+        """Run the pending display sync for a W100 device."""
+        if self._pending_display_syncs.pop(device_name, None) is None:
+            return
+        self._track_display_task(
+            self._display_sync_tasks,
+            self.async_sync_w100_display(device_name),
+            f"w100_display_sync_{device_name}",
+        )
+
+    @callback
+    def _cancel_pending_display_updates(self, device_name: str | None = None) -> None:
+        """Cancel pending display syncs and publishes for one device, or all devices."""
+        device_names = (
+            [device_name] if device_name is not None
+            else [*self._pending_display_updates, *self._pending_display_syncs]
+        )
+        for name in device_names:
+            pending = self._pending_display_updates.pop(name, None)
+            if pending is not None:
+                pending[0]()
+            cancel_sync = self._pending_display_syncs.pop(name, None)
+            if cancel_sync is not None:
+                cancel_sync()
+        if device_name is None:
+            self._scheduled_display_payloads.clear()
+        else:
+            self._scheduled_display_payloads.pop(device_name, None)
+        
+        # Stop running syncs and publishes still retrying so nothing is
+        # queued or sent after removal/unload
+        task_names = (f"w100_display_sync_{device_name}", f"w100_display_publish_{device_name}")
+        for task in [*self._display_sync_tasks, *self._display_publish_tasks]:
+            if device_name is None or task.get_name() in task_names:
+                task.cancel()
+
     async def _async_setup_mqtt_listeners(self) -> None:
         """Legacy method - redirects to new multi-device MQTT setup."""
         await self._async_setup_all_mqtt_listeners()
 
-    async def _async_initialize_all_device_states(self) -> None:
+    @callback
+    def _init_all_device_states(self) -> None:
         """Initialize device states for all configured devices."""
         try:
             # Initialize state for primary device from config entry
             device_name = self.config.get(CONF_W100_DEVICE_NAME)
             if device_name:
-                await self._async_initialize_device_state(device_name, self.config)
+                self._init_device_state(device_name, self.config)
             
             # Initialize states for additional devices from device configs
             for device_name, device_config in self._device_configs.items():
                 if device_name not in self._device_states:
-                    await self._async_initialize_device_state(device_name, device_config)
+                    self._init_device_state(device_name, device_config)
             
             _LOGGER.debug("Initialized states for %d devices", len(self._device_states))
             
         except Exception as err:
             _LOGGER.error("Failed to initialize all device states: %s", err)
 
-    async def _async_initialize_device_state(self, device_name: str, device_config: dict[str, Any]) -> None:
+    @callback
+    def _init_device_state(self, device_name: str, device_config: dict[str, Any]) -> None:
         """Initialize device state for a specific device."""
         try:
             if not device_name:
@@ -1457,42 +1958,41 @@ class W100Coordinator(DataUpdateCoordinator):
             
             # Initialize device state if not exists
             if device_name not in self._device_states:
-                self._device_states[device_name] = {
-                    "device_name": device_name,
-                    "current_mode": "off",
-                    "target_temperature": device_config.get(CONF_IDLE_TEMPERATURE, DEFAULT_TARGET_TEMP),
-                    "current_temperature": None,
-                    "fan_speed": int(device_config.get(CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED)),
-                    "humidity": None,
-                    "last_action": None,
-                    "last_action_time": None,
-                    "display_mode": "temperature",
-                    "beep_enabled": device_config.get(CONF_BEEP_MODE, DEFAULT_BEEP_MODE) != "Disable Beep",
-                    "last_seen": None,
-                    "last_update": datetime.now(),
-                    "config": device_config.copy(),
-                    "status": "initialized",
-                }
+                if device_config is self.config:
+                    fan_speed = self._initial_fan_speed
+                    beep_enabled = self._beep_enabled
+                else:
+                    fan_speed = int(device_config.get(CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED))
+                    beep_enabled = device_config.get(CONF_BEEP_MODE, DEFAULT_BEEP_MODE) != "Disable Beep"
+                
+                self._device_states[device_name] = W100DeviceState(
+                    device_name=device_name,
+                    current_mode="off",
+                    target_temperature=device_config.get(CONF_IDLE_TEMPERATURE, DEFAULT_TARGET_TEMP),
+                    fan_speed=fan_speed,
+                    display_mode="temperature",
+                    beep_enabled=beep_enabled,
+                    last_update=dt_util.utcnow(),
+                    config=device_config.copy(),
+                    status="initialized",
+                )
                 
                 _LOGGER.debug("Initialized device state for %s", device_name)
             else:
                 # Update existing state with current config
-                self._device_states[device_name]["config"] = device_config.copy()
-                self._device_states[device_name]["last_update"] = datetime.now()
+                device_state = self._device_states[device_name]
+                device_state.config = device_config.copy()
+                device_state.last_update = dt_util.utcnow()
                 _LOGGER.debug("Updated device state config for %s", device_name)
             
         except Exception as err:
             _LOGGER.error("Failed to initialize device state for %s: %s", device_name, err)
 
-    async def _async_initialize_device_states(self) -> None:
-        """Legacy method - redirects to new multi-device initialization."""
-        await self._async_initialize_all_device_states()
-
     async def _async_update_device_states(self) -> None:
         """Update device states from current climate entity states for all devices."""
         try:
             # Update primary device from config entry
-            device_name = self.config.get(CONF_W100_DEVICE_NAME)
+            device_name = self._device_name
             if device_name and device_name in self._device_states:
                 await self._async_update_single_device_state(device_name, self.config)
             
@@ -1504,72 +2004,130 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to update device states: %s", err)
 
+    def _parse_humidity_state(self, entity_id: str, raw_state: str) -> float | None:
+        """Return a humidity sensor state as float, or None if it isn't numeric.
+        
+        The conversion is only redone when the sensor's raw state changes.
+        """
+        cached = self._last_humidity_state.get(entity_id)
+        if cached is not None and cached[0] == raw_state:
+            return cached[1]
+        
+        try:
+            humidity_value: float | None = float(raw_state)
+        except (ValueError, TypeError):
+            humidity_value = None
+        
+        self._last_humidity_state[entity_id] = (raw_state, humidity_value)
+        return humidity_value
+
+    @callback
+    def _async_refresh_humidity_listener(self) -> None:
+        """Track state changes of every configured humidity sensor."""
+        sensors: set[str] = set()
+        for config in (self.config, *self._device_configs.values()):
+            for key in (CONF_HUMIDITY_SENSOR, CONF_BACKUP_HUMIDITY_SENSOR):
+                if entity_id := config.get(key):
+                    sensors.add(entity_id)
+        
+        if sensors == self._humidity_sensors:
+            return
+        
+        if self._humidity_unsub is not None:
+            self._humidity_unsub()
+            self._humidity_unsub = None
+        self._humidity_sensors = sensors
+        self._humidity_cache.clear()
+        
+        if not sensors:
+            return
+        
+        # Seed the cache from current states, then follow changes
+        for entity_id in sensors:
+            self._update_humidity_cache(entity_id, self.hass.states.get(entity_id))
+        self._humidity_unsub = async_track_state_change_event(
+            self.hass, list(sensors), self._async_on_humidity_change
+        )
+        _LOGGER.debug("Tracking humidity sensors: %s", sorted(sensors))
+
+    @callback
+    def _async_on_humidity_change(self, event: Event) -> None:
+        """Update the humidity cache when a tracked sensor changes."""
+        self._update_humidity_cache(event.data["entity_id"], event.data.get("new_state"))
+
+    @callback
+    def _update_humidity_cache(self, entity_id: str, state: State | None) -> None:
+        """Store a sensor's clamped humidity value, or drop it if unusable."""
+        if state is None or state.state in _UNAVAILABLE_STATES:
+            self._humidity_cache.pop(entity_id, None)
+            return
+        
+        humidity_value = self._parse_humidity_state(entity_id, state.state)
+        if humidity_value is None:
+            _LOGGER.debug("Invalid humidity value from sensor %s: %s", entity_id, state.state)
+            self._humidity_cache.pop(entity_id, None)
+            return
+        
+        self._humidity_cache[entity_id] = _clamp_humidity(humidity_value)
+
     async def _async_update_single_device_state(self, device_name: str, device_config: dict[str, Any]) -> None:
         """Update device state for a single device."""
         try:
             if device_name not in self._device_states:
                 _LOGGER.debug("Device %s not in states, initializing", device_name)
-                await self._async_initialize_device_state(device_name, device_config)
+                self._init_device_state(device_name, device_config)
                 return
             
             device_state = self._device_states[device_name]
             
-            # Get climate entity (existing or created)
-            climate_entity_id = device_config.get(CONF_EXISTING_CLIMATE_ENTITY)
-            
-            # If no existing climate entity, check for created thermostats for this device
-            if not climate_entity_id:
-                device_thermostats = self._device_thermostats.get(device_name, [])
-                if device_thermostats:
-                    climate_entity_id = device_thermostats[0]  # Use first created thermostat for this device
+            # Get climate entity (existing or created for this device); status must
+            # not report another device's thermostat
+            climate_entity_id = self._get_climate_entity_id(device_name, any_thermostat_fallback=False)
             
             if climate_entity_id:
                 climate_state = self.hass.states.get(climate_entity_id)
-                if climate_state and climate_state.state != STATE_UNAVAILABLE:
+                if climate_state and climate_state.state not in _UNAVAILABLE_STATES:
+                    climate_attrs = climate_state.attributes
                     # Update device state from climate entity
-                    device_state.update({
-                        "current_mode": climate_state.state,
-                        "target_temperature": climate_state.attributes.get("temperature"),
-                        "current_temperature": climate_state.attributes.get("current_temperature"),
-                        "last_update": datetime.now(),
-                        "status": "connected",
-                        "climate_entity_id": climate_entity_id,
-                    })
+                    device_state.current_mode = climate_state.state
+                    device_state.target_temperature = climate_attrs.get("temperature")
+                    device_state.current_temperature = climate_attrs.get("current_temperature")
+                    device_state.last_update = dt_util.utcnow()
+                    device_state.status = "connected"
+                    device_state.climate_entity_id = climate_entity_id
                 else:
-                    device_state.update({
-                        "status": "climate_unavailable",
-                        "last_update": datetime.now(),
-                    })
+                    device_state.status = "climate_unavailable"
+                    device_state.last_update = dt_util.utcnow()
             else:
-                device_state.update({
-                    "status": "no_climate_entity",
-                    "last_update": datetime.now(),
-                })
+                device_state.status = "no_climate_entity"
+                device_state.last_update = dt_util.utcnow()
             
             # Update humidity from sensor if configured
             humidity_sensor = device_config.get(CONF_HUMIDITY_SENSOR)
             if humidity_sensor:
                 humidity_state = self.hass.states.get(humidity_sensor)
-                if humidity_state and humidity_state.state not in [STATE_UNAVAILABLE, "unknown"]:
-                    try:
-                        humidity_value = float(humidity_state.state)
-                        device_state["humidity"] = humidity_value
+                if humidity_state and humidity_state.state not in _UNAVAILABLE_STATES:
+                    humidity_value = self._parse_humidity_state(humidity_sensor, humidity_state.state)
+                    if humidity_value is not None:
+                        device_state.humidity = humidity_value
                         device_state["humidity_sensor_status"] = "connected"
-                    except (ValueError, TypeError):
+                    else:
                         device_state["humidity_sensor_status"] = "invalid_value"
                 else:
                     device_state["humidity_sensor_status"] = "unavailable"
             
             # Update backup humidity sensor if configured
             backup_humidity_sensor = device_config.get(CONF_BACKUP_HUMIDITY_SENSOR)
-            if backup_humidity_sensor and device_state.get("humidity") is None:
+            if backup_humidity_sensor and device_state.humidity is None:
                 backup_humidity_state = self.hass.states.get(backup_humidity_sensor)
-                if backup_humidity_state and backup_humidity_state.state not in [STATE_UNAVAILABLE, "unknown"]:
-                    try:
-                        humidity_value = float(backup_humidity_state.state)
-                        device_state["humidity"] = humidity_value
+                if backup_humidity_state and backup_humidity_state.state not in _UNAVAILABLE_STATES:
+                    humidity_value = self._parse_humidity_state(
+                        backup_humidity_sensor, backup_humidity_state.state
+                    )
+                    if humidity_value is not None:
+                        device_state.humidity = humidity_value
                         device_state["backup_humidity_sensor_status"] = "connected"
-                    except (ValueError, TypeError):
+                    else:
                         device_state["backup_humidity_sensor_status"] = "invalid_value"
                 else:
                     device_state["backup_humidity_sensor_status"] = "unavailable"
@@ -1577,8 +2135,63 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to update device state for %s: %s", device_name, err)
 
+    def _get_climate_entity_id(self, device_name: str, any_thermostat_fallback: bool = True) -> str | None:
+        """Resolve the climate entity controlled by a W100 device.
+        
+        Prefers the device's configured existing climate entity, then the first
+        thermostat created for the device. The per-device result is cached until
+        configs or thermostat tracking change. With any_thermostat_fallback, a
+        device without its own climate entity uses any created thermostat.
+        """
+        if device_name in self._climate_entity_ids:
+            climate_entity_id = self._climate_entity_ids[device_name]
+        else:
+            device_config = self._device_configs.get(device_name, self.config)
+            climate_entity_id = device_config.get(CONF_EXISTING_CLIMATE_ENTITY)
+            
+            # If no existing climate entity, check for created thermostats for this device
+            if not climate_entity_id:
+                device_thermostats = self._device_thermostats.get(device_name, [])
+                if device_thermostats:
+                    climate_entity_id = device_thermostats[0]  # Use first created thermostat for this device
+            
+            self._climate_entity_ids[device_name] = climate_entity_id
+        
+        if not climate_entity_id and any_thermostat_fallback and self._created_thermostats:
+            # Fallback to any created thermostat
+            climate_entity_id = next(iter(self._created_thermostats))
+        return climate_entity_id
+
+    def _get_display_config(self, device_name: str) -> _DisplayConfig:
+        """Return the cached display config snapshot for a W100 device."""
+        display_config = self._display_configs.get(device_name)
+        if display_config is None:
+            display_config = _DisplayConfig.from_config(
+                self._device_configs.get(device_name, self.config)
+            )
+            self._display_configs[device_name] = display_config
+        return display_config
+
+    @callback
+    def _invalidate_device_caches(self) -> None:
+        """Drop cached per-device lookups after config/thermostat changes."""
+        self._climate_entity_ids.clear()
+        self._display_configs.clear()
+
     async def async_handle_w100_action(self, action: str, device_name: str) -> None:
         """Handle W100 button actions with debouncing and error recovery."""
+        accepted = self._async_accept_w100_action(action, device_name)
+        if accepted is not None:
+            await self._async_run_w100_action(action, device_name, *accepted)
+
+    @callback
+    def _async_accept_w100_action(self, action: str, device_name: str) -> tuple[str, State] | None:
+        """Debounce and validate a W100 button action without awaiting.
+        
+        Fires the device trigger event and records the action on the device
+        state. Returns the climate entity id and state to act on, or None if
+        the action was debounced or there is nothing to control.
+        """
         action_context = {
             "device_name": device_name,
             "action": action,
@@ -1594,18 +2207,18 @@ class W100Coordinator(DataUpdateCoordinator):
                 extra=action_context
             )
             
-            # Enhanced debouncing with per-action tracking
-            now = datetime.now()
-            debounce_key = f"{device_name}_{action}"
-            last_action_time = self._last_action_time.get(debounce_key)
+            # Enhanced debouncing with per-action tracking (monotonic clock)
+            monotonic_now = time.monotonic()
+            device_action_times = self._last_action_time.get(device_name)
+            if device_action_times is None:
+                device_action_times = self._last_action_time[device_name] = {}
+            last_action_time = device_action_times.get(action)
             
             # Different debounce times for different actions
-            debounce_time = 0.5  # Default debounce
-            if action == W100_ACTION_TOGGLE:
-                debounce_time = 1.0  # Longer debounce for toggle to prevent accidental double-toggles
+            debounce_time = self._debounce_times.get(action, 0.5)
             
-            if last_action_time and (now - last_action_time).total_seconds() < debounce_time:
-                time_since_last = (now - last_action_time).total_seconds()
+            if last_action_time is not None and monotonic_now - last_action_time < debounce_time:
+                time_since_last = monotonic_now - last_action_time
                 _LOGGER.debug(
                     "Debouncing rapid W100 action '%s' from device '%s' (%.2fs since last, threshold: %.1fs)",
                     action,
@@ -1614,13 +2227,17 @@ class W100Coordinator(DataUpdateCoordinator):
                     debounce_time,
                     extra={**action_context, "debounce_time": time_since_last, "debounce_threshold": debounce_time}
                 )
-                return
+                return None
+            
+            device_action_times[action] = monotonic_now
             
-            self._last_action_time[debounce_key] = now
+            # Wall-clock time is only needed for user-visible fields; captured
+            # once and reused for the event and device state
+            now = dt_util.utcnow()
             
             # Fire device trigger event for automations
             self.hass.bus.async_fire(
-                f"{DOMAIN}_button_action",
+                EVENT_BUTTON_ACTION,
                 {
                     "device_name": device_name,
                     "action": action,
@@ -1630,60 +2247,59 @@ class W100Coordinator(DataUpdateCoordinator):
             )
             
             _LOGGER.debug(
-                "Fired device trigger event: %s_button_action for device %s, action %s",
-                DOMAIN, device_name, action
+                "Fired device trigger event: %s for device %s, action %s",
+                EVENT_BUTTON_ACTION, device_name, action
             )
             
             # Update device state
             if device_name not in self._device_states:
-                await self._async_initialize_device_states()
+                self._init_all_device_states()
             
-            if device_name in self._device_states:
-                self._device_states[device_name].update({
-                    "last_action": action,
-                    "last_action_time": now,
-                })
+            device_state = self._device_states.get(device_name)
+            if device_state is not None:
+                device_state.last_action = action
+                device_state.last_action_time = now
+                # Monotonic twin of last_action_time for display age math
+                device_state.last_action_monotonic = monotonic_now
             
             # Get climate entity to control - check device-specific config first
-            device_config = self._device_configs.get(device_name, self.config)
-            climate_entity_id = device_config.get(CONF_EXISTING_CLIMATE_ENTITY)
-            
-            # If no existing climate entity, check for created thermostats for this device
-            if not climate_entity_id:
-                device_thermostats = self._device_thermostats.get(device_name, [])
-                if device_thermostats:
-                    climate_entity_id = device_thermostats[0]  # Use first created thermostat for this device
-                elif self._created_thermostats:
-                    # Fallback to any created thermostat
-                    climate_entity_id = self._created_thermostats[0]
+            climate_entity_id = self._get_climate_entity_id(device_name)
             
             if not climate_entity_id:
                 _LOGGER.warning("No climate entity configured for W100 device %s", device_name)
-                return
+                return None
             
             climate_state = self.hass.states.get(climate_entity_id)
             if not climate_state:
                 _LOGGER.warning("Climate entity %s not found for W100 device %s", climate_entity_id, device_name)
-                return
+                return None
             
-            if climate_state.state == STATE_UNAVAILABLE:
+            if climate_state.state in _UNAVAILABLE_STATES:
                 _LOGGER.warning("Climate entity %s is unavailable, cannot process W100 action %s", 
                                climate_entity_id, action)
-                return
+                return None
             
+            if action not in self._action_dispatch:
+                _LOGGER.warning("Unknown W100 action received: %s from device %s", action, device_name)
+                return None
+            
+            return climate_entity_id, climate_state
+            
+        except Exception as err:
+            _LOGGER.error("Failed to handle W100 action %s from device %s: %s", action, device_name, err)
+            return None
+
+    async def _async_run_w100_action(
+        self, action: str, device_name: str, climate_entity_id: str, climate_state: State
+    ) -> None:
+        """Run an accepted W100 button action against its climate entity."""
+        try:
             _LOGGER.info("Processing W100 action %s from device %s for climate entity %s", 
                         action, device_name, climate_entity_id)
             
             # Handle different actions
-            if action == W100_ACTION_TOGGLE:
-                await self._async_handle_toggle_action(climate_entity_id, climate_state, device_name)
-            elif action == W100_ACTION_PLUS:
-                await self._async_handle_plus_action(climate_entity_id, climate_state, device_name)
-            elif action == W100_ACTION_MINUS:
-                await self._async_handle_minus_action(climate_entity_id, climate_state, device_name)
-            else:
-                _LOGGER.warning("Unknown W100 action received: %s from device %s", action, device_name)
-                return
+            handler = self._action_dispatch[action]
+            await handler(climate_entity_id, climate_state, device_name)
             
             # Also route action to registered W100 climate entities for this device
             await self._async_route_action_to_w100_entities(action, device_name)
@@ -1702,16 +2318,27 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to sync W100 display for %s: %s", device_name, err)
 
+    def _get_supported_modes(self, climate_entity_id: str, hvac_modes) -> frozenset[str]:
+        """Return the climate entity's HVAC modes as a cached frozenset."""
+        key = (climate_entity_id, tuple(hvac_modes))
+        supported_modes = self._supported_modes_cache.get(key)
+        if supported_modes is None:
+            supported_modes = self._supported_modes_cache[key] = frozenset(hvac_modes)
+        return supported_modes
+
     async def _async_handle_toggle_action(self, climate_entity_id: str, climate_state, device_name: str) -> None:
         """Handle W100 toggle action (double press) - toggles between heat and off modes."""
         try:
             current_mode = climate_state.state
+            climate_attrs = climate_state.attributes
             target_mode = "heat" if current_mode == "off" else "off"
             
             _LOGGER.info("W100 %s toggle: %s -> %s", device_name, current_mode, target_mode)
             
             # Check if target mode is supported
-            supported_modes = climate_state.attributes.get("hvac_modes", [])
+            supported_modes = self._get_supported_modes(
+                climate_entity_id, climate_attrs.get("hvac_modes") or ()
+            )
             if target_mode not in supported_modes:
                 _LOGGER.warning("Climate entity %s does not support mode %s (supported: %s)", 
                                climate_entity_id, target_mode, supported_modes)
@@ -1735,16 +2362,17 @@ class W100Coordinator(DataUpdateCoordinator):
         """Handle W100 plus action - increases temperature in heat mode or fan speed in fan mode."""
         try:
             current_mode = climate_state.state
+            climate_attrs = climate_state.attributes
             
             if current_mode == "heat":
                 # Increase temperature by 0.5°C (W100 compatible increment)
-                current_temp = climate_state.attributes.get("temperature")
+                current_temp = climate_attrs.get("temperature")
                 if current_temp is None:
                     current_temp = DEFAULT_TARGET_TEMP
                     _LOGGER.warning("No current temperature found for %s, using default %s", 
                                    climate_entity_id, DEFAULT_TARGET_TEMP)
                 
-                max_temp = climate_state.attributes.get("max_temp", DEFAULT_MAX_TEMP)
+                max_temp = climate_attrs.get("max_temp", DEFAULT_MAX_TEMP)
                 new_temp = min(float(current_temp) + 0.5, float(max_temp))
                 
                 if new_temp == current_temp:
@@ -1763,8 +2391,8 @@ class W100Coordinator(DataUpdateCoordinator):
                 
             elif current_mode == "fan":
                 # Increase fan speed (if supported)
-                current_fan_speed = climate_state.attributes.get("fan_mode", "1")
-                fan_modes = climate_state.attributes.get("fan_modes", [])
+                current_fan_speed = climate_attrs.get("fan_mode", "1")
+                fan_modes = climate_attrs.get("fan_modes", [])
                 
                 if not fan_modes:
                     _LOGGER.debug("Climate entity %s does not support fan modes", climate_entity_id)
@@ -1816,16 +2444,17 @@ class W100Coordinator(DataUpdateCoordinator):
         """Handle W100 minus action - decreases temperature in heat mode or fan speed in fan mode."""
         try:
             current_mode = climate_state.state
+            climate_attrs = climate_state.attributes
             
             if current_mode == "heat":
                 # Decrease temperature by 0.5°C (W100 compatible increment)
-                current_temp = climate_state.attributes.get("temperature")
+                current_temp = climate_attrs.get("temperature")
                 if current_temp is None:
                     current_temp = DEFAULT_TARGET_TEMP
                     _LOGGER.warning("No current temperature found for %s, using default %s", 
                                    climate_entity_id, DEFAULT_TARGET_TEMP)
                 
-                min_temp = climate_state.attributes.get("min_temp", DEFAULT_MIN_TEMP)
+                min_temp = climate_attrs.get("min_temp", DEFAULT_MIN_TEMP)
                 new_temp = max(float(current_temp) - 0.5, float(min_temp))
                 
                 if new_temp == current_temp:
@@ -1844,8 +2473,8 @@ class W100Coordinator(DataUpdateCoordinator):
                 
             elif current_mode == "fan":
                 # Decrease fan speed (if supported)
-                current_fan_speed = climate_state.attributes.get("fan_mode", "1")
-                fan_modes = climate_state.attributes.get("fan_modes", [])
+                current_fan_speed = climate_attrs.get("fan_mode", "1")
+                fan_modes = climate_attrs.get("fan_modes", [])
                 
                 if not fan_modes:
                     _LOGGER.debug("Climate entity %s does not support fan modes", climate_entity_id)
@@ -1896,8 +2525,15 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_sync_all_displays(self) -> None:
         """Sync all W100 displays with current states."""
         try:
-            for device_name in self._device_states:
-                await self.async_sync_w100_display(device_name)
+            # Snapshot device names so devices added/removed mid-sync don't break iteration
+            device_names = list(self._device_states)
+            results = await asyncio.gather(
+                *(self.async_sync_w100_display(device_name) for device_name in device_names),
+                return_exceptions=True,
+            )
+            for device_name, result in zip(device_names, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Failed to sync W100 display for %s: %s", device_name, result)
         except Exception as err:
             _LOGGER.error("Failed to sync all displays: %s", err)
 
@@ -1932,7 +2568,7 @@ class W100Coordinator(DataUpdateCoordinator):
                     device_name,
                     extra=sync_context
                 )
-                await self._async_initialize_device_states()
+                self._init_all_device_states()
                 if device_name not in self._device_states:
                     _LOGGER.warning(
                         "Failed to initialize device state for '%s'",
@@ -1944,24 +2580,14 @@ class W100Coordinator(DataUpdateCoordinator):
             device_state = self._device_states[device_name]
             
             # Get climate entity state - use device-specific config
-            device_config = self._device_configs.get(device_name, self.config)
-            climate_entity_id = device_config.get(CONF_EXISTING_CLIMATE_ENTITY)
-            
-            # If no existing climate entity, check for created thermostats for this device
-            if not climate_entity_id:
-                device_thermostats = self._device_thermostats.get(device_name, [])
-                if device_thermostats:
-                    climate_entity_id = device_thermostats[0]  # Use first created thermostat for this device
-                elif self._created_thermostats:
-                    # Fallback to any created thermostat
-                    climate_entity_id = self._created_thermostats[0]
+            climate_entity_id = self._get_climate_entity_id(device_name)
             
             if not climate_entity_id:
                 _LOGGER.debug("No climate entity configured for device %s, skipping display sync", device_name)
                 return
             
             climate_state = self.hass.states.get(climate_entity_id)
-            if not climate_state or climate_state.state == STATE_UNAVAILABLE:
+            if not climate_state or climate_state.state in _UNAVAILABLE_STATES:
                 _LOGGER.debug("Climate entity %s unavailable for device %s, using fallback display", 
                              climate_entity_id, device_name)
                 await self._async_sync_fallback_display(device_name, device_state)
@@ -1972,51 +2598,57 @@ class W100Coordinator(DataUpdateCoordinator):
                 _LOGGER.debug("MQTT not available, skipping display sync for %s", device_name)
                 return
             
-            # Prepare comprehensive display update payload
-            display_payload = {}
+            # Prepare comprehensive display update payload; pre-sized from the
+            # template so helpers only overwrite slots, unset ones are dropped below
+            display_payload = dict.fromkeys(_DISPLAY_PAYLOAD_KEYS)
             current_mode = climate_state.state
+            climate_attrs = climate_state.attributes
             
             # Handle display mode switching based on climate entity state
-            if current_mode == "heat":
-                await self._async_sync_heat_mode_display(
-                    device_name, device_state, climate_state, display_payload
-                )
-            elif current_mode == "off":
-                await self._async_sync_off_mode_display(
-                    device_name, device_state, climate_state, display_payload
-                )
-            elif current_mode == "fan":
-                await self._async_sync_fan_mode_display(
-                    device_name, device_state, climate_state, display_payload
-                )
-            elif current_mode == "cool":
-                await self._async_sync_cool_mode_display(
-                    device_name, device_state, climate_state, display_payload
-                )
-            else:
+            mode_handler = self._display_mode_handlers.get(current_mode)
+            if mode_handler is None:
                 _LOGGER.debug("Unknown climate mode %s for %s, using default display", 
                              current_mode, device_name)
-                await self._async_sync_default_display(
-                    device_name, device_state, climate_state, display_payload
-                )
+                mode_handler = self._sync_default_display
+            try:
+                mode_handler(device_name, device_state, climate_attrs, display_payload)
+            except Exception as err:
+                _LOGGER.error("Failed to sync %s mode display for %s: %s", current_mode, device_name, err)
+                fallback = _DISPLAY_MODE_FALLBACKS.get(current_mode)
+                if fallback is not None:
+                    fallback_fields, fallback_display_mode = fallback
+                    display_payload.update(fallback_fields)
+                    device_state.display_mode = fallback_display_mode
             
             # Add humidity synchronization with sensor values
             await self._async_sync_humidity_display(device_name, device_state, display_payload)
             
             # Add additional W100 specific display parameters
             await self._async_sync_advanced_display_features(
-                device_name, device_state, climate_state, display_payload
+                device_name, device_state, climate_attrs, display_payload
             )
+            display_payload = {
+                key: value for key, value in display_payload.items() if value is not None
+            }
+            
+            # Skip the MQTT publish when nothing visible on the display changed;
+            # compared against the last queued payload so a sync back to the
+            # published state still replaces one that is pending or in flight
+            if (
+                device_state.last_sync_mode == current_mode
+                and self._display_payload_unchanged(
+                    self._scheduled_display_payloads.get(device_name), display_payload
+                )
+            ):
+                _LOGGER.debug("W100 display for %s unchanged, skipping publish", device_name)
+                return
             
-            # Send display update via MQTT with retry logic
-            await self._async_send_display_update(device_name, display_payload)
+            # Queue the display update; bursts within the coalesce window publish once
+            self._schedule_display_update(device_name, display_payload)
             
             # Update device state tracking
-            device_state.update({
-                "last_display_sync": datetime.now(),
-                "last_sync_mode": current_mode,
-                "last_sync_payload": display_payload.copy(),
-            })
+            device_state.last_display_sync = dt_util.utcnow()
+            device_state.last_sync_mode = current_mode
             
             _LOGGER.debug("Successfully synced W100 display for %s in mode %s", 
                          device_name, current_mode)
@@ -2029,237 +2661,200 @@ class W100Coordinator(DataUpdateCoordinator):
             except Exception as fallback_err:
                 _LOGGER.error("Fallback display sync also failed for %s: %s", device_name, fallback_err)
 
-    async def _async_sync_heat_mode_display(self, device_name: str, device_state: dict, 
-                                          climate_state, display_payload: dict) -> None:
+    @staticmethod
+    def _display_payload_unchanged(old_payload: dict | None, new_payload: dict) -> bool:
+        """Return True if two display payloads differ only in volatile keys."""
+        if old_payload is None or old_payload.keys() != new_payload.keys():
+            return False
+        return all(
+            old_payload[key] == value
+            for key, value in new_payload.items()
+            if key not in _VOLATILE_DISPLAY_KEYS
+        )
+
+    def _sync_heat_mode_display(self, device_name: str, device_state: W100DeviceState, 
+                              climate_attrs, display_payload: dict) -> None:
         """Sync display for heat mode - shows temperature."""
-        try:
-            # Get device-specific configuration
-            device_config = self._device_configs.get(device_name, self.config)
-            
-            # Get target temperature from climate entity
-            target_temp = climate_state.attributes.get("temperature")
-            if target_temp is None:
-                # Fallback to configured heating temperature
-                target_temp = device_config.get(CONF_HEATING_TEMPERATURE, DEFAULT_HEATING_TEMPERATURE)
-                _LOGGER.debug("No target temperature from climate entity, using configured heating temp %s°C", 
-                             target_temp)
-            
-            # Ensure temperature is within valid range
-            min_temp = climate_state.attributes.get("min_temp", DEFAULT_MIN_TEMP)
-            max_temp = climate_state.attributes.get("max_temp", DEFAULT_MAX_TEMP)
-            target_temp = max(min_temp, min(max_temp, float(target_temp)))
-            
-            # Set temperature display
-            display_payload["temperature"] = target_temp
-            device_state["display_mode"] = "temperature"
-            device_state["target_temperature"] = target_temp
-            
-            # Add current temperature for reference
-            current_temp = climate_state.attributes.get("current_temperature")
-            if current_temp is not None:
-                display_payload["current_temperature"] = float(current_temp)
-                device_state["current_temperature"] = float(current_temp)
-            
-            # Set heating warm level
-            warm_level = device_config.get(CONF_HEATING_WARM_LEVEL, DEFAULT_HEATING_WARM_LEVEL)
-            display_payload["warm_level"] = int(warm_level)
-            
-            _LOGGER.debug("W100 %s heat mode display: temp=%s°C, warm_level=%s", 
-                         device_name, target_temp, warm_level)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to sync heat mode display for %s: %s", device_name, err)
-            # Fallback to basic temperature display
-            display_payload["temperature"] = DEFAULT_HEATING_TEMPERATURE
-            device_state["display_mode"] = "temperature"
+        # Get device-specific configuration
+        display_config = self._get_display_config(device_name)
+        
+        # Get target temperature from climate entity
+        target_temp = climate_attrs.get("temperature")
+        if target_temp is None:
+            # Fallback to configured heating temperature
+            target_temp = display_config.heating_temperature
+            _LOGGER.debug("No target temperature from climate entity, using configured heating temp %s°C", 
+                         target_temp)
+        
+        # Ensure temperature is within valid range
+        min_temp = climate_attrs.get("min_temp", DEFAULT_MIN_TEMP)
+        max_temp = climate_attrs.get("max_temp", DEFAULT_MAX_TEMP)
+        target_temp = max(min_temp, min(max_temp, float(target_temp)))
+        
+        # Set temperature display
+        display_payload["temperature"] = target_temp
+        device_state.display_mode = "temperature"
+        device_state.target_temperature = target_temp
+        
+        # Add current temperature for reference
+        current_temp = climate_attrs.get("current_temperature")
+        if current_temp is not None:
+            display_payload["current_temperature"] = float(current_temp)
+            device_state.current_temperature = float(current_temp)
+        
+        # Set heating warm level
+        warm_level = display_config.heating_warm_level
+        display_payload["warm_level"] = warm_level
+        
+        _LOGGER.debug("W100 %s heat mode display: temp=%s°C, warm_level=%s", 
+                     device_name, target_temp, warm_level)
 
-    async def _async_sync_off_mode_display(self, device_name: str, device_state: dict, 
-                                         climate_state, display_payload: dict) -> None:
+    def _sync_off_mode_display(self, device_name: str, device_state: W100DeviceState, 
+                             climate_attrs, display_payload: dict) -> None:
         """Sync display for off mode - shows fan speed."""
-        try:
-            # Get device-specific configuration
-            device_config = self._device_configs.get(device_name, self.config)
-            
-            # Get configured idle fan speed
-            idle_fan_speed = device_config.get(CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED)
-            fan_speed = int(idle_fan_speed)
-            
-            # Set fan speed display
-            display_payload["fan_speed"] = fan_speed
-            device_state["display_mode"] = "fan_speed"
-            device_state["fan_speed"] = fan_speed
-            
-            # Set idle temperature for reference
-            idle_temp = device_config.get(CONF_IDLE_TEMPERATURE, DEFAULT_IDLE_TEMPERATURE)
-            display_payload["idle_temperature"] = float(idle_temp)
-            
-            # Set idle warm level
-            idle_warm_level = device_config.get(CONF_IDLE_WARM_LEVEL, DEFAULT_IDLE_WARM_LEVEL)
-            display_payload["warm_level"] = int(idle_warm_level)
-            
-            # Add swing mode
-            swing_mode = device_config.get(CONF_SWING_MODE, DEFAULT_SWING_MODE)
-            display_payload["swing_mode"] = swing_mode
-            
-            _LOGGER.debug("W100 %s off mode display: fan_speed=%s, idle_temp=%s°C, swing=%s", 
-                         device_name, fan_speed, idle_temp, swing_mode)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to sync off mode display for %s: %s", device_name, err)
-            # Fallback to basic fan speed display
-            display_payload["fan_speed"] = int(DEFAULT_IDLE_FAN_SPEED)
-            device_state["display_mode"] = "fan_speed"
+        # Get device-specific configuration
+        display_config = self._get_display_config(device_name)
+        
+        # Get configured idle fan speed
+        fan_speed = display_config.idle_fan_speed
+        
+        # Set fan speed display
+        display_payload["fan_speed"] = fan_speed
+        device_state.display_mode = "fan_speed"
+        device_state.fan_speed = fan_speed
+        
+        # Set idle temperature for reference
+        idle_temp = display_config.idle_temperature
+        display_payload["idle_temperature"] = idle_temp
+        
+        # Set idle warm level
+        display_payload["warm_level"] = display_config.idle_warm_level
+        
+        # Add swing mode
+        swing_mode = display_config.swing_mode
+        display_payload["swing_mode"] = swing_mode
+        
+        _LOGGER.debug("W100 %s off mode display: fan_speed=%s, idle_temp=%s°C, swing=%s", 
+                     device_name, fan_speed, idle_temp, swing_mode)
 
-    async def _async_sync_fan_mode_display(self, device_name: str, device_state: dict, 
-                                         climate_state, display_payload: dict) -> None:
+    def _sync_fan_mode_display(self, device_name: str, device_state: W100DeviceState, 
+                             climate_attrs, display_payload: dict) -> None:
         """Sync display for fan mode - shows current fan speed."""
+        # Get current fan speed from climate entity
+        current_fan_speed = climate_attrs.get("fan_mode", "1")
+        
         try:
-            # Get current fan speed from climate entity
-            current_fan_speed = climate_state.attributes.get("fan_mode", "1")
-            
-            try:
-                fan_speed_num = int(current_fan_speed)
-            except (ValueError, TypeError):
-                # Try to map named fan speeds to numbers
-                fan_speed_mapping = {
-                    "low": 1, "medium": 3, "high": 6, "auto": 3,
-                    "quiet": 1, "normal": 3, "turbo": 9
-                }
-                fan_speed_num = fan_speed_mapping.get(current_fan_speed.lower(), 3)
-                _LOGGER.debug("Mapped fan speed '%s' to %s for %s", 
-                             current_fan_speed, fan_speed_num, device_name)
-            
-            # Ensure fan speed is in valid range (1-9)
-            fan_speed_num = max(1, min(9, fan_speed_num))
-            
-            # Set fan speed display
-            display_payload["fan_speed"] = fan_speed_num
-            device_state["display_mode"] = "fan_speed"
-            device_state["fan_speed"] = fan_speed_num
-            
-            # Add swing mode if supported
-            swing_mode = climate_state.attributes.get("swing_mode")
-            if swing_mode:
-                display_payload["swing_mode"] = swing_mode
-            else:
-                # Use configured swing mode
-                swing_mode = self.config.get(CONF_SWING_MODE, DEFAULT_SWING_MODE)
-                display_payload["swing_mode"] = swing_mode
-            
-            _LOGGER.debug("W100 %s fan mode display: fan_speed=%s, swing=%s", 
-                         device_name, fan_speed_num, swing_mode)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to sync fan mode display for %s: %s", device_name, err)
-            # Fallback to default fan speed
-            display_payload["fan_speed"] = 3
-            device_state["display_mode"] = "fan_speed"
+            fan_speed_num = int(current_fan_speed)
+        except (ValueError, TypeError):
+            # Try to map named fan speeds to numbers
+            fan_speed_num = _FAN_SPEED_MAP.get(str(current_fan_speed).lower(), 3)
+            _LOGGER.debug("Mapped fan speed '%s' to %s for %s", 
+                         current_fan_speed, fan_speed_num, device_name)
+        
+        # Ensure fan speed is in valid range (1-9)
+        fan_speed_num = _clamp_fan_speed(fan_speed_num)
+        
+        # Set fan speed display
+        display_payload["fan_speed"] = fan_speed_num
+        device_state.display_mode = "fan_speed"
+        device_state.fan_speed = fan_speed_num
+        
+        # Add swing mode if supported
+        swing_mode = climate_attrs.get("swing_mode")
+        if swing_mode:
+            display_payload["swing_mode"] = swing_mode
+        else:
+            # Use configured swing mode
+            swing_mode = self._get_display_config(device_name).swing_mode
+            display_payload["swing_mode"] = swing_mode
+        
+        _LOGGER.debug("W100 %s fan mode display: fan_speed=%s, swing=%s", 
+                     device_name, fan_speed_num, swing_mode)
 
-    async def _async_sync_cool_mode_display(self, device_name: str, device_state: dict, 
-                                          climate_state, display_payload: dict) -> None:
+    def _sync_cool_mode_display(self, device_name: str, device_state: W100DeviceState, 
+                              climate_attrs, display_payload: dict) -> None:
         """Sync display for cool mode - shows temperature and fan speed."""
+        # Get target temperature
+        target_temp = climate_attrs.get("temperature", DEFAULT_TARGET_TEMP)
+        target_temp = float(target_temp)
+        
+        # Set temperature display
+        display_payload["temperature"] = target_temp
+        device_state.target_temperature = target_temp
+        
+        # Get fan speed for cooling
+        current_fan_speed = climate_attrs.get("fan_mode", "3")
         try:
-            # Get target temperature
-            target_temp = climate_state.attributes.get("temperature", DEFAULT_TARGET_TEMP)
-            target_temp = float(target_temp)
-            
-            # Set temperature display
-            display_payload["temperature"] = target_temp
-            device_state["target_temperature"] = target_temp
-            
-            # Get fan speed for cooling
-            current_fan_speed = climate_state.attributes.get("fan_mode", "3")
-            try:
-                fan_speed_num = int(current_fan_speed)
-            except (ValueError, TypeError):
-                fan_speed_num = 3
-            
-            fan_speed_num = max(1, min(9, fan_speed_num))
-            display_payload["fan_speed"] = fan_speed_num
-            device_state["fan_speed"] = fan_speed_num
-            
-            # Set display mode to show both temperature and fan
-            device_state["display_mode"] = "temperature_fan"
-            
-            _LOGGER.debug("W100 %s cool mode display: temp=%s°C, fan_speed=%s", 
-                         device_name, target_temp, fan_speed_num)
-            
-        except Exception as err:
-            _LOGGER.error("Failed to sync cool mode display for %s: %s", device_name, err)
-            # Fallback to temperature display
-            display_payload["temperature"] = DEFAULT_TARGET_TEMP
-            device_state["display_mode"] = "temperature"
+            fan_speed_num = int(current_fan_speed)
+        except (ValueError, TypeError):
+            fan_speed_num = 3
+        
+        fan_speed_num = _clamp_fan_speed(fan_speed_num)
+        display_payload["fan_speed"] = fan_speed_num
+        device_state.fan_speed = fan_speed_num
+        
+        # Set display mode to show both temperature and fan
+        device_state.display_mode = "temperature_fan"
+        
+        _LOGGER.debug("W100 %s cool mode display: temp=%s°C, fan_speed=%s", 
+                     device_name, target_temp, fan_speed_num)
 
-    async def _async_sync_default_display(self, device_name: str, device_state: dict, 
-                                        climate_state, display_payload: dict) -> None:
+    def _sync_default_display(self, device_name: str, device_state: W100DeviceState, 
+                            climate_attrs, display_payload: dict) -> None:
         """Sync display for unknown/default modes."""
-        try:
-            # Default to showing temperature if available
-            target_temp = climate_state.attributes.get("temperature")
-            if target_temp is not None:
-                display_payload["temperature"] = float(target_temp)
-                device_state["display_mode"] = "temperature"
-                device_state["target_temperature"] = float(target_temp)
-            else:
-                # Fallback to fan speed
-                fan_speed = int(self.config.get(CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED))
-                display_payload["fan_speed"] = fan_speed
-                device_state["display_mode"] = "fan_speed"
-                device_state["fan_speed"] = fan_speed
-            
-            _LOGGER.debug("W100 %s default display mode: %s", 
-                         device_name, device_state["display_mode"])
-            
-        except Exception as err:
-            _LOGGER.error("Failed to sync default display for %s: %s", device_name, err)
+        # Default to showing temperature if available
+        target_temp = climate_attrs.get("temperature")
+        if target_temp is not None:
+            display_payload["temperature"] = float(target_temp)
+            device_state.display_mode = "temperature"
+            device_state.target_temperature = float(target_temp)
+        else:
+            # Fallback to fan speed
+            fan_speed = self._get_display_config(device_name).idle_fan_speed
+            display_payload["fan_speed"] = fan_speed
+            device_state.display_mode = "fan_speed"
+            device_state.fan_speed = fan_speed
+        
+        _LOGGER.debug("W100 %s default display mode: %s", 
+                     device_name, device_state.display_mode)
 
-    async def _async_sync_humidity_display(self, device_name: str, device_state: dict, 
+    async def _async_sync_humidity_display(self, device_name: str, device_state: W100DeviceState, 
                                          display_payload: dict) -> None:
         """Sync humidity display with sensor values."""
         try:
             # Get device-specific configuration
-            device_config = self._device_configs.get(device_name, self.config)
+            display_config = self._get_display_config(device_name)
             humidity_value = None
             
-            # Try primary humidity sensor
-            humidity_sensor = device_config.get(CONF_HUMIDITY_SENSOR)
+            # Try primary humidity sensor (cache is kept current by a state listener)
+            humidity_sensor = display_config.humidity_sensor
             if humidity_sensor:
-                humidity_state = self.hass.states.get(humidity_sensor)
-                if humidity_state and humidity_state.state not in [STATE_UNAVAILABLE, "unknown"]:
-                    try:
-                        humidity_value = float(humidity_state.state)
-                        _LOGGER.debug("Got humidity %s%% from primary sensor %s for %s", 
-                                     humidity_value, humidity_sensor, device_name)
-                    except (ValueError, TypeError):
-                        _LOGGER.debug("Invalid humidity value from primary sensor %s: %s", 
-                                     humidity_sensor, humidity_state.state)
+                humidity_value = self._humidity_cache.get(humidity_sensor)
+                if humidity_value is not None:
+                    _LOGGER.debug("Got humidity %s%% from primary sensor %s for %s", 
+                                 humidity_value, humidity_sensor, device_name)
             
             # Try backup humidity sensor if primary failed
             if humidity_value is None:
-                backup_humidity_sensor = device_config.get(CONF_BACKUP_HUMIDITY_SENSOR)
+                backup_humidity_sensor = display_config.backup_humidity_sensor
                 if backup_humidity_sensor:
-                    backup_state = self.hass.states.get(backup_humidity_sensor)
-                    if backup_state and backup_state.state not in [STATE_UNAVAILABLE, "unknown"]:
-                        try:
-                            humidity_value = float(backup_state.state)
-                            _LOGGER.debug("Got humidity %s%% from backup sensor %s for %s", 
-                                         humidity_value, backup_humidity_sensor, device_name)
-                        except (ValueError, TypeError):
-                            _LOGGER.debug("Invalid humidity value from backup sensor %s: %s", 
-                                         backup_humidity_sensor, backup_state.state)
+                    humidity_value = self._humidity_cache.get(backup_humidity_sensor)
+                    if humidity_value is not None:
+                        _LOGGER.debug("Got humidity %s%% from backup sensor %s for %s", 
+                                     humidity_value, backup_humidity_sensor, device_name)
             
             # Use existing device state humidity if no sensors available
             if humidity_value is None:
-                humidity_value = device_state.get("humidity")
+                humidity_value = device_state.humidity
                 if humidity_value is not None:
                     _LOGGER.debug("Using cached humidity %s%% for %s", humidity_value, device_name)
             
             # Set humidity in display payload if available
             if humidity_value is not None:
                 # Ensure humidity is in valid range (0-100%)
-                humidity_value = max(0, min(100, humidity_value))
+                humidity_value = _clamp_humidity(humidity_value)
                 display_payload["humidity"] = humidity_value
-                device_state["humidity"] = humidity_value
+                device_state.humidity = humidity_value
                 _LOGGER.debug("W100 %s humidity display: %s%%", device_name, humidity_value)
             else:
                 _LOGGER.debug("No humidity data available for %s", device_name)
@@ -2267,43 +2862,33 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to sync humidity display for %s: %s", device_name, err)
 
-    async def _async_sync_advanced_display_features(self, device_name: str, device_state: dict, 
-                                                  climate_state, display_payload: dict) -> None:
+    async def _async_sync_advanced_display_features(self, device_name: str, device_state: W100DeviceState, 
+                                                  climate_attrs, display_payload: dict) -> None:
         """Sync advanced W100 display features and parameters."""
         try:
-            # Get device-specific configuration
-            device_config = self._device_configs.get(device_name, self.config)
-            
             # Add beep mode configuration
-            beep_mode = device_config.get(CONF_BEEP_MODE, DEFAULT_BEEP_MODE)
-            if beep_mode == "Enable Beep":
-                display_payload["beep"] = True
-            elif beep_mode == "Disable Beep":
-                display_payload["beep"] = False
-            elif beep_mode == "On-Mode Change":
-                # Enable beep only for mode changes
-                display_payload["beep_on_change"] = True
-            
-            device_state["beep_enabled"] = beep_mode != "Disable Beep"
+            beep_mode = self._get_display_config(device_name).beep_mode
+            beep_fields, beep_enabled = _BEEP_MODE_DISPLAY.get(beep_mode, _BEEP_MODE_DEFAULT)
+            display_payload.update(beep_fields)
+            device_state.beep_enabled = beep_enabled
             
             # Add display brightness/intensity if supported
             # This could be extended based on W100 capabilities
             display_payload["display_brightness"] = 100  # Full brightness
             
             # Add last action information for display context
-            last_action = device_state.get("last_action")
+            last_action = device_state.last_action
             if last_action:
                 display_payload["last_action"] = last_action
                 
-                # Add action timestamp for display timeout
-                last_action_time = device_state.get("last_action_time")
-                if last_action_time:
-                    time_since_action = (datetime.now() - last_action_time).total_seconds()
-                    display_payload["action_age"] = int(time_since_action)
+                # Add action age for display timeout
+                last_action_monotonic = device_state.last_action_monotonic
+                if last_action_monotonic is not None:
+                    display_payload["action_age"] = int(time.monotonic() - last_action_monotonic)
             
             # Add device status indicators
             display_payload["status"] = "online"
-            display_payload["last_update"] = datetime.now().isoformat()
+            display_payload["last_update_ts"] = int(time.time())
             
             _LOGGER.debug("W100 %s advanced display features: beep=%s, brightness=100", 
                          device_name, beep_mode)
@@ -2311,7 +2896,7 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to sync advanced display features for %s: %s", device_name, err)
 
-    async def _async_sync_fallback_display(self, device_name: str, device_state: dict) -> None:
+    async def _async_sync_fallback_display(self, device_name: str, device_state: Mapping[str, Any]) -> None:
         """Sync fallback display when climate entity is unavailable."""
         try:
             fallback_payload = {}
@@ -2333,9 +2918,9 @@ class W100Coordinator(DataUpdateCoordinator):
             fallback_payload["status"] = "offline"
             fallback_payload["beep"] = False  # Disable beep in fallback mode
             
-            await self._async_send_display_update(device_name, fallback_payload)
+            self._schedule_display_update(device_name, fallback_payload)
             
-            _LOGGER.debug("Sent fallback display update for %s: %s", device_name, fallback_payload)
+            _LOGGER.debug("Queued fallback display update for %s: %s", device_name, fallback_payload)
             
         except Exception as err:
             _LOGGER.error("Failed to send fallback display for %s: %s", device_name, err)
@@ -2347,12 +2932,15 @@ class W100Coordinator(DataUpdateCoordinator):
             return
         
         max_retries = 3
-        retry_delay = 1.0
+        
+        # Set topic is prebuilt at MQTT setup; format it only for unknown devices
+        set_topic = self._set_topics.get(device_name)
+        if set_topic is None:
+            set_topic = MQTT_W100_SET_TOPIC.format(device_name)
         
         for attempt in range(max_retries):
             try:
-                set_topic = MQTT_W100_SET_TOPIC.format(device_name)
-                payload_json = json.dumps(display_payload, default=str)
+                payload_json = _json_dumps(display_payload)
                 
                 await mqtt.async_publish(
                     self.hass,
@@ -2362,6 +2950,10 @@ class W100Coordinator(DataUpdateCoordinator):
                     retain=False
                 )
                 
+                # Payloads are not mutated after sending
+                device_state = self._device_states.get(device_name)
+                if device_state is not None:
+                    device_state.last_sync_payload = display_payload
                 _LOGGER.debug("Sent W100 display update for %s via %s (attempt %d): %s", 
                              device_name, set_topic, attempt + 1, display_payload)
                 return  # Success, exit retry loop
@@ -2371,12 +2963,16 @@ class W100Coordinator(DataUpdateCoordinator):
                                device_name, attempt + 1, max_retries, err)
                 
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+                    # Capped exponential backoff with jitter so retries from many
+                    # devices don't hit a recovering broker in lockstep
+                    retry_delay = min(DISPLAY_RETRY_MAX_DELAY_SECONDS, 2 ** attempt)
+                    await asyncio.sleep(retry_delay * (0.5 + random.random() * 0.5))
                 else:
                     _LOGGER.error("Failed to send display update for %s after %d attempts", 
                                  device_name, max_retries)
-                    raise
+                    # Forget the payload so the next sync publishes it again
+                    if self._scheduled_display_payloads.get(device_name) is display_payload:
+                        del self._scheduled_display_payloads[device_name]
 
     # Keep the old method name for backward compatibility
     async def _async_sync_w100_display(self, device_name: str) -> None:
@@ -2386,21 +2982,44 @@ class W100Coordinator(DataUpdateCoordinator):
     async def async_cleanup(self) -> None:
         """Clean up coordinator resources for all devices."""
         try:
+            # Cancel any pending coalesced listener update
+            if self._pending_update_handle is not None:
+                self._pending_update_handle()
+                self._pending_update_handle = None
+            self._cancel_pending_display_updates()
+            self._last_payload_hash.clear()
+            if self._thermostat_state_unsub is not None:
+                self._thermostat_state_unsub()
+                self._thermostat_state_unsub = None
+            self._tracked_thermostats = frozenset()
+            
             # Unsubscribe from MQTT topics for all devices
             await self._async_cleanup_all_mqtt_subscriptions()
             
             # Clean up created thermostats if requested
-            for entity_id in self._created_thermostats.copy():
+            for entity_id in list(self._created_thermostats):
                 try:
-                    await self.async_remove_generic_thermostat(entity_id)
+                    await self.async_remove_generic_thermostat(entity_id, defer_save=True)
                 except Exception as err:
                     _LOGGER.warning("Failed to cleanup thermostat %s: %s", entity_id, err)
             
+            # Persist the removals once, flushing any pending delayed save
+            await self._async_save_thermostat_data()
+            await self._async_save_device_data()
+            
             # Clear all device tracking
             self._device_states.clear()
             self._device_configs.clear()
             self._device_thermostats.clear()
             self._last_action_time.clear()
+            self._supported_modes_cache.clear()
+            self._last_humidity_state.clear()
+            if self._humidity_unsub is not None:
+                self._humidity_unsub()
+                self._humidity_unsub = None
+            self._humidity_sensors = set()
+            self._humidity_cache.clear()
+            self._invalidate_device_caches()
             
             _LOGGER.info("Coordinator cleanup completed for all devices")
             
@@ -2408,16 +3027,38 @@ class W100Coordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to cleanup coordinator: %s", err)
 
     @property
-    def created_thermostats(self) -> list[str]:
-        """Return list of created thermostat entity IDs."""
-        return self._created_thermostats.copy()
+    def entity_registry(self) -> er.EntityRegistry:
+        """Return the entity registry, resolved once per coordinator."""
+        if self._entity_registry is None:
+            self._entity_registry = er.async_get(self.hass)
+        return self._entity_registry
 
     @property
-    def device_states(self) -> dict[str, dict[str, Any]]:
-        """Return current device states."""
-        return self._device_states.copy()
+    def created_thermostats(self) -> KeysView[str]:
+        """Return a live read-only view of created thermostat entity IDs.
+        
+        Take a snapshot with tuple() before awaiting while iterating it.
+        """
+        return self._created_thermostats.keys()
+
+    @property
+    def thermostat_configs(self) -> Mapping[str, dict[str, Any]]:
+        """Return a read-only view of created thermostat configurations.
+        
+        Use the thermostat create/update/remove methods to change them.
+        """
+        return MappingProxyType(self._thermostat_configs)
 
-    def get_device_state(self, device_name: str) -> dict[str, Any] | None:
+    @property
+    def device_states(self) -> Mapping[str, W100DeviceState]:
+        """Return a read-only view of current device states."""
+        return MappingProxyType(self._device_states)
+
+    def snapshot_device_states(self) -> dict[str, W100DeviceState]:
+        """Return an independent deep copy of current device states."""
+        return copy.deepcopy(self._device_states)
+
+    def get_device_state(self, device_name: str) -> W100DeviceState | None:
         """Get state for a specific device."""
         return self._device_states.get(device_name)
 
@@ -2440,9 +3081,11 @@ class W100Coordinator(DataUpdateCoordinator):
             # Initialize device thermostat tracking
             if device_name not in self._device_thermostats:
                 self._device_thermostats[device_name] = []
+            self._invalidate_device_caches()
+            self._async_refresh_humidity_listener()
             
             # Initialize device state
-            await self._async_initialize_device_state(device_name, device_config)
+            self._init_device_state(device_name, device_config)
             
             # Set up MQTT listeners for the new device
             await self._async_setup_device_mqtt_listeners(device_name)
@@ -2479,19 +3122,17 @@ class W100Coordinator(DataUpdateCoordinator):
             await self._async_cleanup_device_mqtt_subscriptions(device_name)
             
             # Remove device from tracking
-            if device_name in self._device_configs:
-                del self._device_configs[device_name]
-            
-            if device_name in self._device_thermostats:
-                del self._device_thermostats[device_name]
+            self._device_configs.pop(device_name, None)
+            self._device_thermostats.pop(device_name, None)
+            self._device_states.pop(device_name, None)
             
-            if device_name in self._device_states:
-                del self._device_states[device_name]
+            self._last_payload_hash.pop(device_name, None)
+            self._cancel_pending_display_updates(device_name)
+            self._invalidate_device_caches()
+            self._async_refresh_humidity_listener()
             
             # Clean up device-specific action times
-            keys_to_remove = [key for key in self._last_action_time.keys() if key.startswith(f"{device_name}_")]
-            for key in keys_to_remove:
-                del self._last_action_time[key]
+            self._last_action_time.pop(device_name, None)
             
             # Save updated device data to storage
             await self._async_save_device_data()
@@ -2517,9 +3158,11 @@ class W100Coordinator(DataUpdateCoordinator):
             
             # Update device configuration
             self._device_configs[device_name] = device_config.copy()
+            self._invalidate_device_caches()
+            self._async_refresh_humidity_listener()
             
             # Update device state with new config
-            await self._async_initialize_device_state(device_name, device_config)
+            self._init_device_state(device_name, device_config)
             
             # Check if MQTT setup needs to be refreshed
             if old_config.get(CONF_W100_DEVICE_NAME) != device_config.get(CONF_W100_DEVICE_NAME):
@@ -2558,33 +3201,82 @@ class W100Coordinator(DataUpdateCoordinator):
     async def async_remove_all_thermostats(self) -> None:
         """Remove all thermostats created by this integration."""
         try:
-            thermostats_to_remove = self._created_thermostats.copy()
+            entity_registry = self.entity_registry
+            thermostats_to_remove = set(self._created_thermostats)
+            orphan_device_ids: set[str] = set()
             
+            # Entities are going away for good, so skip the disable step and
+            # defer device cleanup until every entity is gone
             for entity_id in thermostats_to_remove:
+                entity_entry = entity_registry.async_get(entity_id)
+                if not entity_entry:
+                    _LOGGER.debug("Thermostat entity %s not found in registry", entity_id)
+                    continue
                 try:
-                    await self.async_remove_generic_thermostat(entity_id)
-                    _LOGGER.info("Removed thermostat %s during cleanup", entity_id)
+                    entity_registry.async_remove(entity_id)
                 except Exception as err:
                     _LOGGER.error("Failed to remove thermostat %s during cleanup: %s", entity_id, err)
+                    continue
+                if entity_entry.device_id:
+                    orphan_device_ids.add(entity_entry.device_id)
+                _LOGGER.info("Removed thermostat %s during cleanup", entity_id)
+            
+            # Each device is checked once, however many thermostats it held
+            for device_id in orphan_device_ids:
+                await self._async_cleanup_device_if_orphaned(device_id)
             
             # Clear all tracking data
+            for thermostats in self._device_thermostats.values():
+                thermostats[:] = [
+                    entity_id for entity_id in thermostats if entity_id not in thermostats_to_remove
+                ]
             self._created_thermostats.clear()
             self._thermostat_configs.clear()
+            self._async_refresh_thermostat_listener()
+            self._invalidate_device_caches()
             
-            # Save empty data to storage
+            # Save empty data to storage once for the whole batch
             await self._async_save_thermostat_data()
+            await self._async_save_device_data()
             
             _LOGGER.info("Removed all thermostats for integration")
             
         except Exception as err:
             _LOGGER.error("Failed to remove all thermostats: %s", err)
 
+    async def async_update_config(self, updates: dict[str, Any]) -> None:
+        """Merge configuration updates into the config entry.
+        
+        The entry update listener applies the change via async_on_entry_update,
+        which compares the W100 device name once rather than per thermostat.
+        """
+        if all(self.entry.data.get(key) == value for key, value in updates.items()):
+            _LOGGER.debug("Configuration update contains no changes, skipping")
+            return
+        
+        self.hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, **updates}
+        )
+
     async def async_on_entry_update(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Handle config entry updates."""
+        # The listener also fires for options/title changes; nothing to do if data is unchanged
+        if entry.data == self.config:
+            _LOGGER.debug("Config entry data unchanged, skipping update")
+            return
+        
         try:
             # Update stored config
             old_config = self.config
             self.config = entry.data
+            self._device_name = self.config.get(CONF_W100_DEVICE_NAME)
+            self._initial_fan_speed = _coerce_config_value(
+                self.config, CONF_IDLE_FAN_SPEED, DEFAULT_IDLE_FAN_SPEED, int
+            )
+            self._beep_enabled = self.config.get(CONF_BEEP_MODE, DEFAULT_BEEP_MODE) != "Disable Beep"
+            self._update_thermostat_names()
+            self._invalidate_device_caches()
+            self._async_refresh_humidity_listener()
             
             # Check if W100 device name changed
             old_device_name = old_config.get(CONF_W100_DEVICE_NAME)
@@ -2617,7 +3309,7 @@ class W100Coordinator(DataUpdateCoordinator):
                             self._device_thermostats[new_device_name] = self._device_thermostats.pop(old_device_name)
                 
                 # Initialize new device state if needed
-                await self._async_initialize_all_device_states()
+                self._init_all_device_states()
                 
                 # Save updated device data
                 await self._async_save_device_data()
@@ -2709,7 +3401,7 @@ class W100Coordinator(DataUpdateCoordinator):
                     if climate_state:
                         device_status["climate_entity"] = {
                             "entity_id": climate_entity,
-                            "available": climate_state.state != "unavailable"
+                            "available": climate_state.state not in _UNAVAILABLE_STATES
                         }
                     else:
                         device_status["issues"].append({
@@ -2726,7 +3418,7 @@ class W100Coordinator(DataUpdateCoordinator):
                     thermostat_state = self.hass.states.get(thermostat_id)
                     device_status["thermostats"].append({
                         "entity_id": thermostat_id,
-                        "available": bool(thermostat_state and thermostat_state.state != "unavailable")
+                        "available": bool(thermostat_state and thermostat_state.state not in _UNAVAILABLE_STATES)
                     })
                 
                 validation_result["device_status"][device_name] = device_status
@@ -2757,15 +3449,17 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_cleanup_all_mqtt_subscriptions(self) -> None:
         """Clean up all existing MQTT subscriptions for all devices."""
         try:
-            for device_name, topics in self._mqtt_subscriptions.items():
-                for topic in topics:
-                    try:
-                        await mqtt.async_unsubscribe(self.hass, topic)
-                        _LOGGER.debug("Unsubscribed from MQTT topic: %s for device %s", topic, device_name)
-                    except Exception as err:
-                        _LOGGER.warning("Failed to unsubscribe from %s for device %s: %s", topic, device_name, err)
+            for device_name, sub_state in self._mqtt_sub_states.items():
+                try:
+                    async_unsubscribe_topics(self.hass, sub_state)
+                    _LOGGER.debug("Unsubscribed from MQTT topics %s for device %s",
+                                 self._mqtt_subscriptions.get(device_name, []), device_name)
+                except Exception as err:
+                    _LOGGER.warning("Failed to unsubscribe MQTT topics for device %s: %s", device_name, err)
             
+            self._mqtt_sub_states.clear()
             self._mqtt_subscriptions.clear()
+            self._set_topics.clear()
             
         except Exception as err:
             _LOGGER.error("Failed to cleanup all MQTT subscriptions: %s", err)
@@ -2774,15 +3468,15 @@ class W100Coordinator(DataUpdateCoordinator):
         """Clean up MQTT subscriptions for a specific device."""
         try:
             if device_name in self._mqtt_subscriptions:
-                topics = self._mqtt_subscriptions[device_name]
-                for topic in topics:
+                sub_state = self._mqtt_sub_states.pop(device_name, None)
+                if sub_state:
                     try:
-                        await mqtt.async_unsubscribe(self.hass, topic)
-                        _LOGGER.debug("Unsubscribed from MQTT topic: %s for device %s", topic, device_name)
+                        async_unsubscribe_topics(self.hass, sub_state)
                     except Exception as err:
-                        _LOGGER.warning("Failed to unsubscribe from %s for device %s: %s", topic, device_name, err)
+                        _LOGGER.warning("Failed to unsubscribe MQTT topics for device %s: %s", device_name, err)
                 
                 del self._mqtt_subscriptions[device_name]
+                self._set_topics.pop(device_name, None)
                 _LOGGER.debug("Cleaned up MQTT subscriptions for device %s", device_name)
             
         except Exception as err:
@@ -2810,20 +3504,21 @@ class W100Coordinator(DataUpdateCoordinator):
                         _LOGGER.error("Failed to update thermostat %s with new config: %s", entity_id, err)
             
             # Check if other settings changed that affect display sync
-            display_affecting_keys = [
+            display_affecting_keys = (
                 CONF_HEATING_TEMPERATURE,
                 CONF_IDLE_TEMPERATURE,
                 CONF_IDLE_FAN_SPEED,
                 CONF_BEEP_MODE,
-            ]
-            
-            config_changed = any(
-                old_config.get(key) != new_config.get(key)
-                for key in display_affecting_keys
             )
             
-            if config_changed:
-                _LOGGER.debug("Display-affecting configuration changed, updating device states")
+            changed_keys = {
+                key for key in display_affecting_keys
+                if old_config.get(key) != new_config.get(key)
+            }
+            
+            if changed_keys:
+                _LOGGER.debug("Display-affecting configuration changed (%s), updating device states",
+                             ", ".join(sorted(changed_keys)))
                 
                 # Update primary device config in device configs
                 primary_device = new_config.get(CONF_W100_DEVICE_NAME)
@@ -2836,8 +3531,15 @@ class W100Coordinator(DataUpdateCoordinator):
                         if key in new_config:
                             self._device_configs[primary_device][key] = new_config[key]
                 
-                await self._async_initialize_all_device_states()
-                await self._async_sync_all_displays()
+                self._invalidate_device_caches()
+                
+                if changed_keys == {CONF_BEEP_MODE} and primary_device in self._device_states:
+                    # Beep mode only touches the beep fields; patch them in place
+                    # instead of re-initializing and republishing every device
+                    self._async_update_beep_display(primary_device, new_config.get(CONF_BEEP_MODE))
+                else:
+                    self._init_all_device_states()
+                    await self._async_sync_all_displays()
                 
                 # Save updated device data
                 await self._async_save_device_data()
@@ -2845,13 +3547,36 @@ class W100Coordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to handle config changes: %s", err)
 
+    @callback
+    def _async_update_beep_display(self, device_name: str, beep_mode: str | None) -> None:
+        """Apply a beep mode change to a W100 device's state and display.
+        
+        The beep fields are patched into the last queued payload and queued
+        like any other display update, so the device still receives a complete
+        payload and last_sync_payload stays accurate.
+        """
+        device_state = self._device_states[device_name]
+        beep_fields, beep_enabled = _BEEP_MODE_DISPLAY.get(beep_mode, _BEEP_MODE_DEFAULT)
+        device_state.beep_enabled = beep_enabled
+        if device_state.config is not None:
+            device_state.config[CONF_BEEP_MODE] = beep_mode
+        
+        base_payload = self._scheduled_display_payloads.get(device_name)
+        if base_payload is None or base_payload.get("status") != "online":
+            # Nothing to patch, or the fallback display (which never beeps) is shown
+            self._schedule_display_sync(device_name)
+            return
+        
+        display_payload = {
+            key: value for key, value in base_payload.items() if key not in _BEEP_DISPLAY_KEYS
+        }
+        display_payload.update(beep_fields)
+        display_payload["last_update_ts"] = int(time.time())
+        self._schedule_display_update(device_name, display_payload)
+
     async def async_register_w100_climate_entity(self, device_name: str, entity_id: str) -> None:
         """Register a W100 climate entity for button press handling."""
         try:
-            # Initialize device climate entities tracking if not exists
-            if not hasattr(self, '_device_climate_entities'):
-                self._device_climate_entities = {}
-            
             if device_name not in self._device_climate_entities:
                 self._device_climate_entities[device_name] = []
             
@@ -2876,9 +3601,6 @@ class W100Coordinator(DataUpdateCoordinator):
     async def _async_route_action_to_w100_entities(self, action: str, device_name: str) -> None:
         """Route W100 action to registered W100 climate entities."""
         try:
-            if not hasattr(self, '_device_climate_entities'):
-                return
-            
             climate_entities = self._device_climate_entities.get(device_name, [])
             if not climate_entities:
                 return
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import voluptuous as vol
@@ -15,7 +18,7 @@ from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, EVENT_BUTTON_ACTION
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,10 +28,17 @@ TRIGGER_TYPE_BUTTON_PLUS = "button_plus"
 TRIGGER_TYPE_BUTTON_MINUS = "button_minus"
 
 # All supported trigger types
-TRIGGER_TYPES = {
+TRIGGER_TYPES = frozenset({
     TRIGGER_TYPE_BUTTON_TOGGLE,
     TRIGGER_TYPE_BUTTON_PLUS,
     TRIGGER_TYPE_BUTTON_MINUS,
+})
+
+# Trigger types mapped to W100 action events
+_TRIGGER_ACTIONS: dict[str, str] = {
+    TRIGGER_TYPE_BUTTON_TOGGLE: "toggle",
+    TRIGGER_TYPE_BUTTON_PLUS: "plus",
+    TRIGGER_TYPE_BUTTON_MINUS: "minus",
 }
 
 # Trigger schema with comprehensive validation
@@ -50,68 +60,111 @@ EVENT_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Identifier prefix of the logical W100 control devices created by the integration
+W100_CONTROL_IDENTIFIER_PREFIX = "w100_control_"
+
+
+def _get_w100_device_name(identifiers: set[tuple[str, str]]) -> str | None:
+    """Return the W100 device name from a control device's identifiers."""
+    for domain, identifier in identifiers:
+        if domain == DOMAIN:
+            device_name = identifier.removeprefix(W100_CONTROL_IDENTIFIER_PREFIX)
+            if device_name != identifier:
+                return device_name
+    return None
+
+
+# device_id -> (identifiers the name was parsed from, parsed W100 device name);
+# bounded like the trigger descriptor cache, oldest entries are evicted first
+_DEVICE_NAME_CACHE_SIZE = 256
+_DEVICE_NAME_CACHE: dict[str, tuple[set[tuple[str, str]], str | None]] = {}
+
+
+def _extract_w100_name(device: dr.DeviceEntry) -> str | None:
+    """Return the W100 device name for a device entry, parsing identifiers once.
+    
+    Registry updates replace the identifiers set, so an identity check is
+    enough to detect a stale entry.
+    """
+    cached = _DEVICE_NAME_CACHE.get(device.id)
+    if cached is not None and cached[0] is device.identifiers:
+        return cached[1]
+    device_name = _get_w100_device_name(device.identifiers)
+    if cached is None and len(_DEVICE_NAME_CACHE) >= _DEVICE_NAME_CACHE_SIZE:
+        del _DEVICE_NAME_CACHE[next(iter(_DEVICE_NAME_CACHE))]
+    _DEVICE_NAME_CACHE[device.id] = (device.identifiers, device_name)
+    return device_name
+
+
+def clear_device_name_cache() -> None:
+    """Drop cached W100 device names, e.g. when a config entry is unloaded."""
+    _DEVICE_NAME_CACHE.clear()
+
+
+# Trigger type -> (button label, metadata description), in listing order
+_TRIGGER_DESCRIPTIONS: tuple[tuple[str, str, str], ...] = (
+    (
+        TRIGGER_TYPE_BUTTON_TOGGLE,
+        "Toggle",
+        "Triggered when the center button is double-pressed (toggle heat/off)",
+    ),
+    (
+        TRIGGER_TYPE_BUTTON_PLUS,
+        "Plus",
+        "Triggered when the plus button is pressed (increase temp/fan speed)",
+    ),
+    (
+        TRIGGER_TYPE_BUTTON_MINUS,
+        "Minus",
+        "Triggered when the minus button is pressed (decrease temp/fan speed)",
+    ),
+)
+
+
+@lru_cache(maxsize=256)
+def _build_triggers(device_id: str, device_name: str) -> tuple[dict[str, Any], ...]:
+    """Build the trigger descriptors for a W100 control device."""
+    friendly_name = device_name.replace('_', ' ').title()
+    return tuple(
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+            "subtype": device_name,
+            "metadata": {
+                "name": f"W100 {friendly_name} {label} Button",
+                "description": description,
+            },
+        }
+        for trigger_type, label, description in _TRIGGER_DESCRIPTIONS
+    )
+
 
 async def async_get_triggers(
     hass: HomeAssistant, device_id: str
-) -> list[dict[str, Any]]:
+) -> Sequence[dict[str, Any]]:
     """List device triggers for W100 devices."""
     device_registry = dr.async_get(hass)
     device = device_registry.async_get(device_id)
     
+    # HA asks every device for triggers; the empty tuple is a shared constant,
+    # so non-W100 devices don't cost an allocation
     if not device:
-        return []
-    
-    # Check if this is a W100 control device (logical device created by our integration)
-    w100_control_identifier = None
-    for identifier in device.identifiers:
-        if identifier[0] == DOMAIN and identifier[1].startswith("w100_control_"):
-            w100_control_identifier = identifier[1]
-            break
-    
-    if not w100_control_identifier:
-        return []
-    
-    # Extract device name from identifier (w100_control_device_name -> device_name)
-    device_name = w100_control_identifier.replace("w100_control_", "")
-    
-    # Return available triggers for this W100 device
-    triggers = []
+        return ()
     
-    triggers.append({
-        CONF_PLATFORM: "device",
-        CONF_DOMAIN: DOMAIN,
-        CONF_DEVICE_ID: device_id,
-        CONF_TYPE: TRIGGER_TYPE_BUTTON_TOGGLE,
-        "subtype": device_name,
-        "metadata": {
-            "name": f"W100 {device_name.replace('_', ' ').title()} Toggle Button",
-            "description": "Triggered when the center button is double-pressed (toggle heat/off)",
-        },
-    })
-    
-    triggers.append({
-        CONF_PLATFORM: "device",
-        CONF_DOMAIN: DOMAIN,
-        CONF_DEVICE_ID: device_id,
-        CONF_TYPE: TRIGGER_TYPE_BUTTON_PLUS,
-        "subtype": device_name,
-        "metadata": {
-            "name": f"W100 {device_name.replace('_', ' ').title()} Plus Button",
-            "description": "Triggered when the plus button is pressed (increase temp/fan speed)",
-        },
-    })
+    # Only W100 control devices (logical devices created by our integration) have triggers;
+    # the device name follows the identifier prefix (w100_control_device_name -> device_name)
+    device_name = _extract_w100_name(device)
+    if not device_name:
+        return ()
     
-    triggers.append({
-        CONF_PLATFORM: "device",
-        CONF_DOMAIN: DOMAIN,
-        CONF_DEVICE_ID: device_id,
-        CONF_TYPE: TRIGGER_TYPE_BUTTON_MINUS,
-        "subtype": device_name,
-        "metadata": {
-            "name": f"W100 {device_name.replace('_', ' ').title()} Minus Button",
-            "description": "Triggered when the minus button is pressed (decrease temp/fan speed)",
-        },
-    })
+    # Return available triggers for this W100 device; copy the cached descriptors
+    # so callers can't mutate the shared ones
+    triggers = [
+        {**trigger, "metadata": dict(trigger["metadata"])}
+        for trigger in _build_triggers(device_id, device_name)
+    ]
     
     _LOGGER.debug(
         "Found %d triggers for W100 device %s (device_id: %s)",
@@ -138,26 +191,14 @@ async def async_attach_trigger(
         return lambda: None
     
     # Extract device name from device identifiers
-    device_name = None
-    for identifier in device.identifiers:
-        if identifier[0] == DOMAIN and identifier[1].startswith("w100_control_"):
-            device_name = identifier[1].replace("w100_control_", "")
-            break
-    
+    device_name = _extract_w100_name(device)
     if not device_name:
         _LOGGER.error("W100 device name not found for device: %s", config[CONF_DEVICE_ID])
         return lambda: None
     
     trigger_type = config[CONF_TYPE]
     
-    # Map trigger types to W100 action events
-    action_map = {
-        TRIGGER_TYPE_BUTTON_TOGGLE: "toggle",
-        TRIGGER_TYPE_BUTTON_PLUS: "plus",
-        TRIGGER_TYPE_BUTTON_MINUS: "minus",
-    }
-    
-    w100_action = action_map.get(trigger_type)
+    w100_action = _TRIGGER_ACTIONS.get(trigger_type)
     if not w100_action:
         _LOGGER.error("Unknown trigger type: %s", trigger_type)
         return lambda: None
@@ -166,7 +207,7 @@ async def async_attach_trigger(
     event_config = event_trigger.TRIGGER_SCHEMA(
         {
             event_trigger.CONF_PLATFORM: "event",
-            event_trigger.CONF_EVENT_TYPE: f"{DOMAIN}_button_action",
+            event_trigger.CONF_EVENT_TYPE: EVENT_BUTTON_ACTION,
             event_trigger.CONF_EVENT_DATA: {
                 "device_name": device_name,
                 "action": w100_action,
@@ -215,10 +256,11 @@ async def async_register_automation_triggers(hass: HomeAssistant) -> None:
         
         w100_devices = []
         for device in device_registry.devices.values():
-            for identifier in device.identifiers:
-                if identifier[0] == DOMAIN and identifier[1].startswith("w100_control_"):
-                    w100_devices.append(device)
-                    break
+            device_name = _extract_w100_name(device)
+            if device_name:
+                w100_devices.append((device, device_name))
+                # Warm the descriptor cache so the first UI trigger listing is a cache hit
+                _build_triggers(device.id, device_name)
         
         _LOGGER.info(
             "Registered %d W100 devices for automation triggers",
@@ -226,33 +268,40 @@ async def async_register_automation_triggers(hass: HomeAssistant) -> None:
         )
         
         # Log available trigger types for documentation
-        for device in w100_devices:
-            device_name = None
-            for identifier in device.identifiers:
-                if identifier[0] == DOMAIN and identifier[1].startswith("w100_control_"):
-                    device_name = identifier[1].replace("w100_control_", "")
-                    break
-            
-            if device_name:
-                _LOGGER.debug(
-                    "W100 device %s (ID: %s) supports triggers: %s",
-                    device_name,
-                    device.id,
-                    ", ".join(TRIGGER_TYPES)
-                )
+        for device, device_name in w100_devices:
+            _LOGGER.debug(
+                "W100 device %s (ID: %s) supports triggers: %s",
+                device_name,
+                device.id,
+                ", ".join(TRIGGER_TYPES)
+            )
         
     except Exception as err:
         _LOGGER.error("Failed to register automation triggers: %s", err)
 
 
-def get_trigger_documentation() -> dict[str, Any]:
-    """Get comprehensive trigger documentation for automation system."""
-    return {
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of nested dicts (as mapping proxies) and lists (as tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def get_trigger_documentation() -> Mapping[str, Any]:
+    """Get comprehensive trigger documentation for automation system.
+    
+    The documentation is static, so it is built once and shared deeply
+    read-only: nested dicts are mapping proxies and lists are tuples.
+    """
+    return _freeze({
         "triggers": {
             TRIGGER_TYPE_BUTTON_TOGGLE: {
                 "name": "W100 Toggle Button",
                 "description": "Triggered when the center button is double-pressed (toggle heat/off)",
-                "event_type": f"{DOMAIN}_button_action",
+                "event_type": EVENT_BUTTON_ACTION,
                 "event_data": {
                     "action": "toggle",
                     "device_name": "string",
@@ -275,7 +324,7 @@ def get_trigger_documentation() -> dict[str, Any]:
             TRIGGER_TYPE_BUTTON_PLUS: {
                 "name": "W100 Plus Button",
                 "description": "Triggered when the plus button is pressed (increase temp/fan speed)",
-                "event_type": f"{DOMAIN}_button_action",
+                "event_type": EVENT_BUTTON_ACTION,
                 "event_data": {
                     "action": "plus",
                     "device_name": "string",
@@ -299,7 +348,7 @@ def get_trigger_documentation() -> dict[str, Any]:
             TRIGGER_TYPE_BUTTON_MINUS: {
                 "name": "W100 Minus Button",
                 "description": "Triggered when the minus button is pressed (decrease temp/fan speed)",
-                "event_type": f"{DOMAIN}_button_action",
+                "event_type": EVENT_BUTTON_ACTION,
                 "event_data": {
                     "action": "minus",
                     "device_name": "string",
@@ -324,4 +373,4 @@ def get_trigger_documentation() -> dict[str, Any]:
         "event_schema": EVENT_DATA_SCHEMA,
         "supported_platforms": ["device", "event"],
         "integration_domain": DOMAIN,
-    }
\ No newline at end of file
+    })
\ No newline at end of file
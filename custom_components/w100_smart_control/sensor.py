@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -18,6 +17,7 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfTemperature,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -283,7 +283,7 @@ class W100ConnectionSensor(W100BaseSensor):
         last_action_time = device_state.get("last_action_time")
         if last_action_time:
             # If we have recent activity, connection is good
-            time_diff = datetime.now() - last_action_time
+            time_diff = dt_util.utcnow() - last_action_time
             if time_diff.total_seconds() < 300:  # 5 minutes
                 return "connected"
         
@@ -308,7 +308,7 @@ class W100ConnectionSensor(W100BaseSensor):
         if device_state:
             last_action_time = device_state.get("last_action_time")
             if last_action_time:
-                time_diff = datetime.now() - last_action_time
+                time_diff = dt_util.utcnow() - last_action_time
                 attributes["seconds_since_last_action"] = int(time_diff.total_seconds())
         
         # Add coordinator connection info
@@ -152,6 +152,328 @@ async def test_debounce_logic():
     print("✓ Debounce logic test passed")
 
 
+def create_mock_hass():
+    """Create a mock Home Assistant instance for coordinator tests."""
+    hass = Mock()
+    hass.data = {}
+    hass.config.config_dir = "/tmp/test_config"
+    return hass
+
+
+def create_test_coordinator(hass):
+    """Create a coordinator for the living room W100 test device."""
+    entry = Mock()
+    entry.entry_id = "test_entry"
+    entry.data = {"w100_device_name": "living_room_w100"}
+    
+    from w100_smart_control.coordinator import W100Coordinator
+    
+    return W100Coordinator(hass, entry)
+
+
+async def test_display_updates_coalesce():
+    """Test back-to-back display updates for a device publish once."""
+    print("Testing display update coalescing...")
+    
+    hass = create_mock_hass()
+    # Close scheduled coroutines; the publish itself is asserted on the mock
+    hass.async_create_task = Mock(side_effect=lambda coro, name=None: coro.close() or Mock())
+    coordinator = create_test_coordinator(hass)
+    cancel = Mock()
+    
+    with patch('w100_smart_control.coordinator.async_call_later',
+               return_value=cancel) as mock_call_later, \
+         patch.object(coordinator, '_async_send_display_update', new=AsyncMock()) as mock_send:
+        
+        coordinator._schedule_display_update("living_room_w100", {"temperature": 21.0})
+        coordinator._schedule_display_update("living_room_w100", {"temperature": 22.0})
+        
+        # Only one timer for the device, holding the newest payload
+        assert mock_call_later.call_count == 1
+        assert not mock_send.called
+        
+        flush = mock_call_later.call_args[0][2]
+        flush(None)
+        
+        mock_send.assert_called_once_with("living_room_w100", {"temperature": 22.0})
+        assert "living_room_w100" not in coordinator._pending_display_updates
+        
+        # A late timer callback after the flush publishes nothing more
+        flush(None)
+        assert mock_send.call_count == 1
+    
+    print("✓ Display update coalescing test passed")
+
+
+async def test_cancel_pending_display_updates():
+    """Test pending display publishes and syncs are cancelled."""
+    print("Testing pending display update cancellation...")
+    
+    hass = create_mock_hass()
+    coordinator = create_test_coordinator(hass)
+    cancel_update = Mock()
+    cancel_sync = Mock()
+    
+    with patch('w100_smart_control.coordinator.async_call_later',
+               side_effect=[cancel_update, cancel_sync]):
+        coordinator._schedule_display_update("living_room_w100", {"temperature": 21.0})
+        coordinator._schedule_display_sync("living_room_w100")
+    
+    coordinator._cancel_pending_display_updates("living_room_w100")
+    
+    cancel_update.assert_called_once_with()
+    cancel_sync.assert_called_once_with()
+    assert not coordinator._pending_display_updates
+    assert not coordinator._pending_display_syncs
+    
+    print("✓ Pending display update cancellation test passed")
+
+
+async def test_cancel_in_flight_display_publishes():
+    """Test publishes still retrying are tracked and cancelled."""
+    print("Testing in-flight display publish cancellation...")
+    
+    hass = create_mock_hass()
+    loop = asyncio.get_running_loop()
+    hass.async_create_task = lambda coro, name=None: loop.create_task(coro, name=name)
+    coordinator = create_test_coordinator(hass)
+    publish_started = asyncio.Event()
+    
+    async def slow_publish(*args, **kwargs):
+        publish_started.set()
+        await asyncio.sleep(3600)
+    
+    with patch('w100_smart_control.coordinator.async_call_later',
+               return_value=Mock()) as mock_call_later, \
+         patch('w100_smart_control.coordinator.mqtt.async_publish',
+               side_effect=slow_publish):
+        coordinator._schedule_display_update("living_room_w100", {"temperature": 21.0})
+        coordinator._schedule_display_update("bedroom_w100", {"temperature": 19.0})
+        for call in mock_call_later.call_args_list:
+            call[0][2](None)
+        await publish_started.wait()
+        assert len(coordinator._display_publish_tasks) == 2
+        
+        tasks = list(coordinator._display_publish_tasks)
+        
+        # Cancelling one device leaves the other device's publish running
+        coordinator._cancel_pending_display_updates("living_room_w100")
+        living_room_task = next(
+            task for task in tasks if task.get_name().endswith("living_room_w100")
+        )
+        await asyncio.gather(living_room_task, return_exceptions=True)
+        assert living_room_task.cancelled()
+        assert len(coordinator._display_publish_tasks) == 1
+        
+        coordinator._cancel_pending_display_updates()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert not coordinator._display_publish_tasks
+    
+    print("✓ In-flight display publish cancellation test passed")
+
+
+async def test_cancel_running_display_syncs():
+    """Test display syncs already running are tracked and cancelled."""
+    print("Testing running display sync cancellation...")
+    
+    hass = create_mock_hass()
+    loop = asyncio.get_running_loop()
+    hass.async_create_task = lambda coro, name=None: loop.create_task(coro, name=name)
+    coordinator = create_test_coordinator(hass)
+    sync_started = asyncio.Event()
+    
+    async def slow_sync(device_name):
+        sync_started.set()
+        await asyncio.sleep(3600)
+        coordinator._schedule_display_update(device_name, {"temperature": 21.0})
+    
+    with patch('w100_smart_control.coordinator.async_call_later',
+               return_value=Mock()) as mock_call_later, \
+         patch.object(coordinator, 'async_sync_w100_display', side_effect=slow_sync):
+        coordinator._schedule_display_sync("living_room_w100")
+        mock_call_later.call_args[0][2](None)
+        await sync_started.wait()
+        tasks = list(coordinator._display_sync_tasks)
+        assert len(tasks) == 1
+        
+        coordinator._cancel_pending_display_updates("living_room_w100")
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # The cancelled sync queued no publish for the removed device
+        assert tasks[0].cancelled()
+        assert not coordinator._display_sync_tasks
+        assert not coordinator._pending_display_updates
+    
+    print("✓ Running display sync cancellation test passed")
+
+
+async def test_unchanged_display_payload_not_requeued():
+    """Test a payload matching the last queued one is not published again."""
+    print("Testing display payload dedup...")
+    
+    hass = create_mock_hass()
+    coordinator = create_test_coordinator(hass)
+    payload = {"fan_speed": 3, "status": "offline", "beep": False}
+    
+    with patch('w100_smart_control.coordinator.async_call_later',
+               return_value=Mock()) as mock_call_later:
+        coordinator._schedule_display_update("living_room_w100", payload)
+        mock_call_later.call_args[0][2](None)
+        
+        # A repeated fallback payload queues nothing, even before it is published
+        coordinator._schedule_display_update("living_room_w100", dict(payload))
+        assert mock_call_later.call_count == 1
+        
+        coordinator._schedule_display_update("living_room_w100", {**payload, "fan_speed": 4})
+        assert mock_call_later.call_count == 2
+    
+    print("✓ Display payload dedup test passed")
+
+
+async def test_sync_back_to_published_payload_while_in_flight():
+    """Test a sync back to the published display replaces a publish still in flight."""
+    print("Testing display sync while a publish is in flight...")
+    
+    from w100_smart_control.coordinator import W100DeviceState, _json_loads
+    
+    hass = create_mock_hass()
+    loop = asyncio.get_running_loop()
+    hass.async_create_task = lambda coro, name=None: loop.create_task(coro, name=name)
+    hass.states.get.return_value = Mock(state="heat", attributes={})
+    hass.services.has_service.return_value = True
+    coordinator = create_test_coordinator(hass)
+    coordinator._device_states = {"living_room_w100": W100DeviceState(device_name="living_room_w100")}
+    target = {"temperature": 21.0}
+    coordinator._display_mode_handlers = {
+        "heat": lambda device_name, device_state, attrs, payload: payload.update(target),
+    }
+    
+    published = []
+    hold_publish = asyncio.Event()
+    
+    async def publish(hass, topic, payload, **kwargs):
+        temperature = _json_loads(payload)["temperature"]
+        if temperature == 22.0:
+            await hold_publish.wait()
+        published.append(temperature)
+    
+    async def sync_and_flush(temperature):
+        target["temperature"] = temperature
+        await coordinator.async_sync_w100_display("living_room_w100")
+        mock_call_later.call_args[0][2](None)
+        await asyncio.sleep(0)
+    
+    with patch('w100_smart_control.coordinator.async_call_later',
+               return_value=Mock()) as mock_call_later, \
+         patch('w100_smart_control.coordinator.mqtt.async_publish', side_effect=publish), \
+         patch.object(coordinator, '_get_climate_entity_id', return_value="climate.living_room"), \
+         patch.object(coordinator, '_async_sync_humidity_display', new=AsyncMock()), \
+         patch.object(coordinator, '_async_sync_advanced_display_features', new=AsyncMock()):
+        # A is published, then B is held mid-publish
+        await sync_and_flush(21.0)
+        assert published == [21.0]
+        await sync_and_flush(22.0)
+        assert published == [21.0]
+        
+        # Syncing back to A must publish it rather than match the published A
+        await sync_and_flush(21.0)
+        hold_publish.set()
+        await asyncio.gather(*coordinator._display_publish_tasks, return_exceptions=True)
+    
+    # The stale B publish was superseded, so the display ends on A
+    assert published == [21.0, 21.0]
+    
+    print("✓ Display sync while a publish is in flight test passed")
+
+
+async def test_display_publish_gives_up_quietly():
+    """Test a publish that fails every retry logs and returns instead of raising."""
+    print("Testing display publish final failure...")
+    
+    hass = create_mock_hass()
+    coordinator = create_test_coordinator(hass)
+    payload = {"temperature": 21.0}
+    coordinator._scheduled_display_payloads["living_room_w100"] = payload
+    
+    with patch('w100_smart_control.coordinator.mqtt.async_publish',
+               new=AsyncMock(side_effect=Exception("broker down"))) as mock_publish, \
+         patch('w100_smart_control.coordinator.asyncio.sleep', new=AsyncMock()):
+        await coordinator._async_send_display_update("living_room_w100", payload)
+    
+    assert mock_publish.call_count == 3
+    # The payload is forgotten so the next sync queues it again
+    assert "living_room_w100" not in coordinator._scheduled_display_payloads
+    
+    print("✓ Display publish final failure test passed")
+
+
+async def test_beep_mode_change_patches_last_payload():
+    """Test a beep-only config change queues the full display payload."""
+    print("Testing beep mode display patch...")
+    
+    from w100_smart_control.coordinator import W100DeviceState
+    
+    hass = create_mock_hass()
+    coordinator = create_test_coordinator(hass)
+    device_state = W100DeviceState(device_name="living_room_w100")
+    coordinator._device_states = {"living_room_w100": device_state}
+    coordinator._scheduled_display_payloads["living_room_w100"] = {
+        "temperature": 22.0, "beep": True, "status": "online", "last_update_ts": 1,
+    }
+    
+    with patch.object(coordinator, '_schedule_display_update') as mock_schedule:
+        coordinator._async_update_beep_display("living_room_w100", "Disable Beep")
+    
+    assert mock_schedule.call_count == 1
+    device_name, payload = mock_schedule.call_args[0]
+    assert device_name == "living_room_w100"
+    assert payload["temperature"] == 22.0
+    assert payload["beep"] is False
+    assert payload["status"] == "online"
+    assert device_state.beep_enabled is False
+    
+    # Switching beep modes drops the previous mode's fields
+    coordinator._scheduled_display_payloads["living_room_w100"] = payload
+    with patch.object(coordinator, '_schedule_display_update') as mock_schedule:
+        coordinator._async_update_beep_display("living_room_w100", "On-Mode Change")
+    
+    payload = mock_schedule.call_args[0][1]
+    assert payload["beep_on_change"] is True
+    assert "beep" not in payload
+    assert device_state.beep_enabled is True
+    
+    print("✓ Beep mode display patch test passed")
+
+
+async def test_fallback_display_for_mqtt_created_state():
+    """Test the fallback display for a state created from an MQTT message."""
+    print("Testing fallback display for MQTT-created device state...")
+    
+    from w100_smart_control.coordinator import W100DeviceState
+    
+    hass = create_mock_hass()
+    coordinator = create_test_coordinator(hass)
+    # The state handler creates states with only the device name set
+    device_state = W100DeviceState(device_name="living_room_w100")
+    
+    with patch.object(coordinator, '_schedule_display_update') as mock_schedule:
+        await coordinator._async_sync_fallback_display("living_room_w100", device_state)
+    
+    mock_schedule.assert_called_once_with(
+        "living_room_w100", {"fan_speed": 3, "status": "offline", "beep": False}
+    )
+    
+    # Temperature display falls back to the default heating temperature
+    device_state.display_mode = "temperature"
+    with patch.object(coordinator, '_schedule_display_update') as mock_schedule:
+        await coordinator._async_sync_fallback_display("living_room_w100", device_state)
+    
+    payload = mock_schedule.call_args[0][1]
+    assert payload["temperature"] == 30.0
+    
+    print("✓ Fallback display for MQTT-created device state test passed")
+
+
 def main():
     """Run all tests."""
     print("Running advanced features tests...\n")
@@ -164,6 +486,15 @@ def main():
         
         # Run asynchronous tests
         asyncio.run(test_debounce_logic())
+        asyncio.run(test_display_updates_coalesce())
+        asyncio.run(test_cancel_pending_display_updates())
+        asyncio.run(test_cancel_in_flight_display_publishes())
+        asyncio.run(test_cancel_running_display_syncs())
+        asyncio.run(test_unchanged_display_payload_not_requeued())
+        asyncio.run(test_sync_back_to_published_payload_while_in_flight())
+        asyncio.run(test_display_publish_gives_up_quietly())
+        asyncio.run(test_beep_mode_change_patches_last_payload())
+        asyncio.run(test_fallback_display_for_mqtt_created_state())
         
         print("\n✅ All advanced features tests passed!")
         return 0
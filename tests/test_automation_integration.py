@@ -187,6 +187,19 @@ async def test_trigger_documentation():
     assert "device" in docs["supported_platforms"]
     assert "event" in docs["supported_platforms"]
     
+    # Verify the shared documentation can't be mutated by callers
+    for mutate in (
+        lambda: docs["triggers"].pop("button_toggle"),
+        lambda: docs["triggers"]["button_plus"]["event_data"].update(action="minus"),
+        lambda: docs["supported_platforms"].append("state"),
+    ):
+        try:
+            mutate()
+            assert False, "Documentation should be read-only"
+        except (TypeError, AttributeError):
+            pass
+    assert get_trigger_documentation()["triggers"]["button_plus"]["event_data"]["action"] == "plus"
+    
     _LOGGER.info("✓ Trigger documentation test passed")
 
 async def test_event_data_validation():
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Test script for the W100 Smart Control coordinator state handling."""
+
+import asyncio
+import logging
+from unittest.mock import Mock, AsyncMock, patch
+from datetime import datetime
+
+# Set up logging
+logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
+
+class MockHomeAssistant:
+    """Mock Home Assistant instance for testing."""
+    
+    def __init__(self):
+        self.data = {}
+        self.states = Mock()
+        self.config_entries = Mock()
+        self.helpers = Mock()
+        self.config = Mock()
+        self.config.config_dir = "/tmp/test_config"
+        self.bus = Mock()
+        
+    async def async_create_task(self, coro):
+        """Mock async_create_task."""
+        return await coro
+
+def create_test_coordinator(hass):
+    """Create a coordinator for the living room W100 test device."""
+    entry = Mock()
+    entry.entry_id = "test_entry"
+    entry.data = {"w100_device_name": "living_room_w100"}
+    
+    from custom_components.w100_smart_control.coordinator import W100Coordinator
+    
+    return W100Coordinator(hass, entry)
+
+async def test_device_state_ignores_other_devices_thermostats():
+    """Test a device without its own thermostat doesn't report another device's."""
+    _LOGGER.info("Testing per-device climate entity resolution...")
+    
+    from custom_components.w100_smart_control.coordinator import W100DeviceState
+    
+    hass = MockHomeAssistant()
+    coordinator = create_test_coordinator(hass)
+    coordinator._created_thermostats = {"climate.bedroom_w100_thermostat": None}
+    coordinator._device_thermostats = {"bedroom_w100": ["climate.bedroom_w100_thermostat"]}
+    coordinator._device_states = {"living_room_w100": W100DeviceState(device_name="living_room_w100")}
+    
+    await coordinator._async_update_single_device_state("living_room_w100", {})
+    
+    device_state = coordinator._device_states["living_room_w100"]
+    assert device_state.status == "no_climate_entity"
+    assert device_state.climate_entity_id is None
+    
+    # Button actions still fall back to any created thermostat
+    assert coordinator._get_climate_entity_id("living_room_w100") == "climate.bedroom_w100_thermostat"
+    
+    _LOGGER.info("✓ Per-device climate entity resolution test passed")
+
+async def test_json_fast_path():
+    """Test W100 payloads round-trip through the coordinator's JSON helpers."""
+    _LOGGER.info("Testing JSON fast path...")
+    
+    from custom_components.w100_smart_control.coordinator import (
+        _JSON_DECODE_ERRORS,
+        _json_dumps,
+        _json_loads,
+    )
+    
+    # MQTT payloads arrive as str or bytes
+    assert _json_loads('{"temperature": 21.5, "humidity": 45}') == {"temperature": 21.5, "humidity": 45}
+    assert _json_loads(b'{"battery": 90}') == {"battery": 90}
+    
+    # Display payloads serialize to bytes; non-JSON values fall back to str()
+    payload = _json_dumps({"temperature": 22.0, "beep": True, "since": datetime(2024, 1, 1)})
+    assert isinstance(payload, bytes)
+    decoded = _json_loads(payload)
+    assert decoded["temperature"] == 22.0
+    assert decoded["beep"] is True
+    assert decoded["since"].startswith("2024-01-01")
+    
+    try:
+        _json_loads("{not json")
+        assert False, "Should have raised a JSON decode error"
+    except _JSON_DECODE_ERRORS:
+        pass
+    
+    _LOGGER.info("✓ JSON fast path test passed")
+
+async def test_state_messages_dedup_and_coalesce():
+    """Test repeated W100 state payloads are skipped and updates are coalesced."""
+    _LOGGER.info("Testing W100 state message dedup...")
+    
+    hass = MockHomeAssistant()
+    coordinator = create_test_coordinator(hass)
+    
+    with patch('custom_components.w100_smart_control.coordinator.async_prepare_subscribe_topics') as mock_prepare, \
+         patch('custom_components.w100_smart_control.coordinator.async_subscribe_topics', new=AsyncMock()):
+        await coordinator._async_setup_device_mqtt_listeners("living_room_w100")
+    
+    handle_w100_state = mock_prepare.call_args[0][2]["w100_state"]["msg_callback"]
+    
+    def message(payload):
+        msg = Mock()
+        msg.payload = payload
+        return msg
+    
+    with patch('custom_components.w100_smart_control.coordinator.async_call_later',
+               return_value=Mock()) as mock_call_later:
+        handle_w100_state(message('{"temperature": 21.5, "battery": 90}'))
+        handle_w100_state(message('{"temperature": 21.0, "battery": 90}'))
+        
+        device_state = coordinator._device_states["living_room_w100"]
+        assert device_state.get("temperature") == 21.0
+        assert device_state["battery"] == 90
+        # Both messages share one pending coordinator update
+        assert mock_call_later.call_count == 1
+        
+        # A repeated payload is not parsed again but still marks the device as seen
+        device_state.last_seen = None
+        with patch('custom_components.w100_smart_control.coordinator._json_loads') as mock_loads:
+            handle_w100_state(message('{"temperature": 21.0, "battery": 90}'))
+        assert not mock_loads.called
+        assert device_state.last_seen is not None
+    
+    await coordinator.async_cleanup()
+    assert not coordinator._last_payload_hash
+    
+    _LOGGER.info("✓ W100 state message dedup test passed")
+
+async def test_debounced_actions_create_no_task():
+    """Test button presses are debounced inline before any task is created."""
+    _LOGGER.info("Testing inline W100 action debounce...")
+    
+    hass = MockHomeAssistant()
+    # Close scheduled coroutines; only the number of tasks matters here
+    hass.async_create_task = Mock(side_effect=lambda coro: coro.close())
+    hass.states.get.return_value = Mock(state="heat", attributes={})
+    coordinator = create_test_coordinator(hass)
+    
+    with patch('custom_components.w100_smart_control.coordinator.async_prepare_subscribe_topics') as mock_prepare, \
+         patch('custom_components.w100_smart_control.coordinator.async_subscribe_topics', new=AsyncMock()):
+        await coordinator._async_setup_device_mqtt_listeners("living_room_w100")
+    
+    handle_w100_action = mock_prepare.call_args[0][2]["w100_action"]["msg_callback"]
+    msg = Mock()
+    msg.payload = "plus"
+    
+    with patch.object(coordinator, '_get_climate_entity_id', return_value="climate.living_room"):
+        handle_w100_action(msg)
+        handle_w100_action(msg)
+    
+    # The trigger event fires and a task runs only for the first press
+    assert hass.bus.async_fire.call_count == 1
+    assert hass.async_create_task.call_count == 1
+    
+    # Without a climate entity the press is still reported but needs no task
+    msg.payload = "minus"
+    with patch.object(coordinator, '_get_climate_entity_id', return_value=None):
+        handle_w100_action(msg)
+    assert hass.bus.async_fire.call_count == 2
+    assert hass.async_create_task.call_count == 1
+    
+    _LOGGER.info("✓ Inline W100 action debounce test passed")
+
+async def test_supported_modes_cache():
+    """Test HVAC mode membership uses a cached frozenset per entity and mode list."""
+    _LOGGER.info("Testing supported HVAC modes cache...")
+    
+    hass = MockHomeAssistant()
+    coordinator = create_test_coordinator(hass)
+    
+    modes = coordinator._get_supported_modes("climate.living_room", ["off", "heat"])
+    assert modes == frozenset({"off", "heat"})
+    assert coordinator._get_supported_modes("climate.living_room", ["off", "heat"]) is modes
+    
+    # A changed mode list yields a new entry
+    assert "cool" in coordinator._get_supported_modes("climate.living_room", ["off", "heat", "cool"])
+    
+    _LOGGER.info("✓ Supported HVAC modes cache test passed")
+
+async def test_device_state_mapping_semantics():
+    """Test W100DeviceState behaves like the plain dict it replaced."""
+    _LOGGER.info("Testing W100DeviceState mapping semantics...")
+    
+    from custom_components.w100_smart_control.coordinator import W100DeviceState
+    
+    device_state = W100DeviceState(device_name="living_room_w100")
+    
+    # Fields and extra keys are readable by key
+    assert device_state["device_name"] == "living_room_w100"
+    device_state["fan_speed"] = 5
+    assert device_state.fan_speed == 5
+    device_state["battery"] = 90
+    assert device_state["battery"] == 90
+    assert device_state.extra == {"battery": 90}
+    
+    # Unset fields and missing keys fall back to the caller's default
+    assert device_state.get("target_temperature", 22.0) == 22.0
+    assert device_state.get("linkquality", 0) == 0
+    assert device_state.get("fan_speed", 3) == 5
+    try:
+        device_state["linkquality"]
+        assert False, "Missing extra key should raise KeyError"
+    except KeyError:
+        pass
+    
+    # update() writes fields and extras alike
+    device_state.update({"temperature": 21.5, "humidity": 40.0})
+    assert device_state.humidity == 40.0
+    assert device_state["temperature"] == 21.5
+    
+    # Fields can't be deleted, extras can
+    try:
+        del device_state["fan_speed"]
+        assert False, "Deleting a field should raise KeyError"
+    except KeyError:
+        pass
+    del device_state["battery"]
+    assert "battery" not in device_state.extra
+    
+    keys = list(device_state)
+    assert keys[0] == "device_name"
+    assert "temperature" in keys
+    assert len(device_state) == len(keys)
+    
+    _LOGGER.info("✓ W100DeviceState mapping semantics test passed")
+
+async def test_update_config_skips_unchanged_values():
+    """Test async_update_config only updates the entry when a value changes."""
+    _LOGGER.info("Testing config update short-circuit...")
+    
+    hass = MockHomeAssistant()
+    coordinator = create_test_coordinator(hass)
+    entry = coordinator.entry
+    
+    await coordinator.async_update_config({"w100_device_name": "living_room_w100"})
+    assert not hass.config_entries.async_update_entry.called
+    
+    await coordinator.async_update_config({"idle_fan_speed": "2"})
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry, data={"w100_device_name": "living_room_w100", "idle_fan_speed": "2"}
+    )
+    
+    # The update listener ignores entry updates that leave the data unchanged
+    with patch.object(coordinator, '_async_handle_config_changes', new=AsyncMock()) as mock_changes:
+        await coordinator.async_on_entry_update(hass, entry)
+    assert not mock_changes.called
+    
+    _LOGGER.info("✓ Config update short-circuit test passed")
+
+async def test_device_rename_drops_stale_climate_lookup():
+    """Test a lookup cached mid-rename doesn't outlive the rename."""
+    _LOGGER.info("Testing climate entity cache across a device rename...")
+    
+    from custom_components.w100_smart_control.coordinator import W100DeviceState
+    
+    hass = MockHomeAssistant()
+    coordinator = create_test_coordinator(hass)
+    coordinator._device_states = {"living_room_w100": W100DeviceState(device_name="living_room_w100")}
+    coordinator._device_thermostats = {"living_room_w100": ["climate.living_room_w100_thermostat"]}
+    entry = Mock()
+    entry.data = {"w100_device_name": "kitchen_w100"}
+    
+    async def setup_listeners(device_name):
+        # A retained message on the new topic resolves the climate entity
+        # before the thermostats are moved to the new name
+        assert coordinator._get_climate_entity_id(device_name, any_thermostat_fallback=False) is None
+    
+    with patch.object(coordinator, '_async_cleanup_device_mqtt_subscriptions', new=AsyncMock()), \
+         patch.object(coordinator, '_async_setup_device_mqtt_listeners', side_effect=setup_listeners), \
+         patch.object(coordinator, '_update_thermostat_names'), \
+         patch.object(coordinator, '_async_refresh_humidity_listener'), \
+         patch.object(coordinator, '_init_all_device_states'), \
+         patch.object(coordinator, '_async_save_device_data', new=AsyncMock()), \
+         patch.object(coordinator, '_async_handle_config_changes', new=AsyncMock()):
+        await coordinator.async_on_entry_update(hass, entry)
+    
+    assert coordinator._get_climate_entity_id(
+        "kitchen_w100", any_thermostat_fallback=False
+    ) == "climate.living_room_w100_thermostat"
+    
+    _LOGGER.info("✓ Climate entity cache across a device rename test passed")
+
+async def main():
+    """Run all coordinator tests."""
+    _LOGGER.info("Starting W100 Smart Control coordinator tests...")
+    
+    try:
+        await test_device_state_ignores_other_devices_thermostats()
+        await test_json_fast_path()
+        await test_state_messages_dedup_and_coalesce()
+        await test_debounced_actions_create_no_task()
+        await test_supported_modes_cache()
+        await test_device_state_mapping_semantics()
+        await test_update_config_skips_unchanged_values()
+        await test_device_rename_drops_stale_climate_lookup()
+        
+        _LOGGER.info("🎉 All coordinator tests passed!")
+        
+    except Exception as err:
+        _LOGGER.error("❌ Coordinator test failed: %s", err)
+        raise
+
+if __name__ == "__main__":
+    asyncio.run(main())
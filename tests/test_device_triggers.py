@@ -123,6 +123,36 @@ async def test_get_triggers_for_non_w100_device():
         
         _LOGGER.info("✓ Get triggers for non-W100 device test passed")
 
+async def test_device_name_cache_is_bounded():
+    """Test the parsed device name cache is bounded and tracks identifier changes."""
+    _LOGGER.info("Testing device name cache...")
+    
+    from custom_components.w100_smart_control import device_trigger
+    
+    device_trigger.clear_device_name_cache()
+    
+    device = MockDevice(
+        "test_device_id", {("w100_smart_control", "w100_control_living_room_w100")}, "W100"
+    )
+    assert device_trigger._extract_w100_name(device) == "living_room_w100"
+    
+    # Registry updates replace the identifiers set
+    device.identifiers = {("w100_smart_control", "w100_control_bedroom_w100")}
+    assert device_trigger._extract_w100_name(device) == "bedroom_w100"
+    assert len(device_trigger._DEVICE_NAME_CACHE) == 1
+    
+    for index in range(device_trigger._DEVICE_NAME_CACHE_SIZE + 10):
+        device_trigger._extract_w100_name(
+            MockDevice(f"other_device_{index}", {("other_integration", "device")}, "Other")
+        )
+    assert len(device_trigger._DEVICE_NAME_CACHE) == device_trigger._DEVICE_NAME_CACHE_SIZE
+    assert "test_device_id" not in device_trigger._DEVICE_NAME_CACHE
+    
+    device_trigger.clear_device_name_cache()
+    assert not device_trigger._DEVICE_NAME_CACHE
+    
+    _LOGGER.info("✓ Device name cache test passed")
+
 async def test_attach_trigger():
     """Test attaching a trigger."""
     _LOGGER.info("Testing attach trigger...")
@@ -219,14 +249,14 @@ async def test_coordinator_trigger_event_firing():
     entry.data = {"w100_device_name": "living_room_w100"}
     
     # Import coordinator
-    from custom_components.w100_smart_control.coordinator import W100Coordinator
+    from custom_components.w100_smart_control.coordinator import W100Coordinator, W100DeviceState
     
     coordinator = W100Coordinator(hass, entry)
-    coordinator._device_states = {"living_room_w100": {}}
+    coordinator._device_states = {"living_room_w100": W100DeviceState(device_name="living_room_w100")}
     coordinator._last_action_time = {}
     
     # Mock the climate entity processing to avoid errors
-    with patch.object(coordinator, '_async_initialize_device_states', new_callable=AsyncMock):
+    with patch.object(coordinator, '_init_all_device_states'):
         # Test action handling
         await coordinator.async_handle_w100_action("toggle", "living_room_w100")
         
@@ -253,6 +283,7 @@ async def main():
     try:
         await test_get_triggers_for_w100_device()
         await test_get_triggers_for_non_w100_device()
+        await test_device_name_cache_is_bounded()
         await test_attach_trigger()
         await test_trigger_validation()
         await test_coordinator_trigger_event_firing()
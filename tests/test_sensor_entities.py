@@ -4,7 +4,9 @@
 import asyncio
 import logging
 from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
@@ -50,20 +52,20 @@ class MockCoordinator:
         self.data = {
             "device_name": "living_room_w100",
             "status": "connected",
-            "last_update": datetime.now(),
+            "last_update": dt_util.utcnow(),
             "created_thermostats": 1,
             "device_states": {
                 "living_room_w100": {
                     "humidity": 45,
                     "last_action": "toggle",
-                    "last_action_time": datetime.now() - timedelta(minutes=2),
+                    "last_action_time": dt_util.utcnow() - timedelta(minutes=2),
                     "display_mode": "temperature",
                     "connection_status": "connected",
                     "current_mode": "heat",
                     "target_temperature": 22.0,
                     "current_temperature": 21.5,
                     "fan_speed": 3,
-                    "last_update": datetime.now(),
+                    "last_update": dt_util.utcnow(),
                 }
             }
         }